@@ -102,6 +102,20 @@ class BasePlugin(ABC):
     Similar ao sistema de plugins do OpenKore mas mais estruturado.
     """
     
+    # Atributos fixos; subclasses podem declarar os seus próprios __slots__
+    __slots__ = (
+        'logger', 'event_bus', 'info', 'status', 'loaded_at', 'activated_at',
+        'error_message', 'config', 'event_handlers', 'command_handlers',
+        'hooks', 'plugin_dir', 'data_dir', 'dependencies', 'dependents',
+        '__weakref__'
+    )
+    
+    # Ganchos opcionais do ciclo de vida. Ficam como None até existir uma
+    # implementação real, evitando chamadas vazias em cada load/activate.
+    _check_dependencies: Optional[Callable[[], bool]] = None
+    _register_commands: Optional[Callable[[], None]] = None
+    _unregister_commands: Optional[Callable[[], None]] = None
+    
     def __init__(self,
                  logger: Optional[Logger] = None,
                  event_bus: Optional[EventBus] = None):
@@ -179,7 +193,7 @@ class BasePlugin(ABC):
             self.logger.info(f"Carregando plugin: {self.get_name()}")
             
             # Verifica dependências
-            if not self._check_dependencies():
+            if self._check_dependencies is not None and not self._check_dependencies():
                 self.status = PluginStatus.ERROR
                 self.error_message = "Dependências não atendidas"
                 return False
@@ -224,7 +238,8 @@ class BasePlugin(ABC):
             self._register_event_handlers()
             
             # Registra comandos
-            self._register_commands()
+            if self._register_commands is not None:
+                self._register_commands()
             
             # Chama método de ativação personalizado
             if not self.on_activate():
@@ -267,7 +282,8 @@ class BasePlugin(ABC):
             self._unregister_event_handlers()
             
             # Remove comandos
-            self._unregister_commands()
+            if self._unregister_commands is not None:
+                self._unregister_commands()
             
             self.status = PluginStatus.INACTIVE
             
@@ -417,16 +433,6 @@ class BasePlugin(ABC):
         if command in self.command_handlers:
             del self.command_handlers[command]
     
-    def _register_commands(self) -> None:
-        """Registra comandos no sistema."""
-        # TODO: Integrar com sistema de comandos
-        pass
-    
-    def _unregister_commands(self) -> None:
-        """Remove comandos do sistema."""
-        # TODO: Integrar com sistema de comandos
-        pass
-    
     # Hooks
     def add_hook(self, hook_name: str, handler: Callable) -> None:
         """
@@ -474,11 +480,6 @@ class BasePlugin(ABC):
         return results
     
     # Verificações e validações
-    def _check_dependencies(self) -> bool:
-        """Verifica se dependências estão atendidas."""
-        # TODO: Implementar verificação de dependências
-        return True
-    
     def is_compatible(self, pythonkore_version: str) -> bool:
         """
         Verifica compatibilidade com versão do PythonKore.
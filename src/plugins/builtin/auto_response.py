@@ -6,12 +6,135 @@ Plugin para respostas automáticas no chat.
 Similar ao autoResponse do OpenKore.
 """
 
+import random
 import re
 import time
-from typing import Dict, List, Any, Optional
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from functools import partial
+from typing import Dict, List, Any, Callable, Optional, Tuple, Union
 
 from base_plugin import BasePlugin, PluginInfo, PluginType
 
+# RE2 (google-re2) é opcional: garante matching em tempo linear
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# pyahocorasick é opcional: pré-filtro de literais antes do regex
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Flags inline globais no início do padrão, ex: "(?i)" ou "(?i)(?s)"
+_GLOBAL_FLAGS_RE = re.compile(r'(?:\(\?[aiLmsux]+\))+')
+
+
+def _split_global_flags(pattern: str) -> tuple:
+    """Separa as flags globais iniciais do corpo: "(?i)(?s)a.b" -> ("is", "a.b")."""
+    match = _GLOBAL_FLAGS_RE.match(pattern)
+    if not match:
+        return '', pattern
+    flags = ''.join(dict.fromkeys(re.sub(r'[(?)]', '', match.group())))
+    return flags, pattern[match.end():]
+
+
+def _scope_inline_flags(pattern: str) -> str:
+    """
+    Converte flags inline globais em flags de escopo.
+    
+    Flags globais só são permitidas no início da expressão, então
+    "(?i)hi|oi" vira "(?i:hi|oi)" para poder entrar em uma alternação.
+    """
+    flags, body = _split_global_flags(pattern)
+    if not flags:
+        return pattern
+    return f"(?{flags}:{body})"
+
+
+def _fold_case_flag(pattern: str) -> str:
+    """
+    Adapta padrão para a alternação compilada com "(?i)" global.
+    
+    O "(?i)" inicial do padrão é removido, já que a alternação inteira
+    é case-insensitive; padrões sem ele ficam em "(?-i:...)" e
+    continuam diferenciando maiúsculas.
+    """
+    flags, body = _split_global_flags(pattern)
+    if 'i' not in flags:
+        return f"(?-i:{_scope_inline_flags(pattern)})"
+    
+    flags = flags.replace('i', '')
+    return f"(?{flags}:{body})" if flags else body
+
+
+# Tipo de chat -> (evento, chave de configuração, valor padrão)
+_CHANNELS = {
+    'public': ('chat_message', 'respond_to_public', True),
+    'private': ('private_message', 'respond_to_pm', True),
+    'guild': ('guild_message', 'respond_to_guild', False),
+    'party': ('party_message', 'respond_to_party', False),
+}
+
+# Limite de jogadores rastreados para cooldown
+_MAX_TRACKED_PLAYERS = 4096
+
+# Variáveis de template nas respostas, ex: "{player}"
+_VAR_RE = re.compile(r'\{(\w+)\}')
+
+# Referências a grupos por número (ou condicionais), que mudariam de
+# sentido dentro da alternação combinada, ex: r"(\w)\1"
+_GROUP_REF_RE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+# Padrão formado apenas por palavras ASCII alternadas, ex: "(?i)hi|hello"
+_LITERAL_WORDS_RE = re.compile(r'\(\?i\)(\w+(?:\|\w+)*)', re.ASCII)
+
+# Curingas aceitos entre literais ao extrair trechos obrigatórios
+_WILDCARD_RE = re.compile(r'\.[*+?]?')
+_METACHARS = frozenset('\\^$.*+?{}[]()|')
+_ASCII_RUN_RE = re.compile(r'[\x00-\x7f]+')
+
+# Únicos caracteres não-ASCII que o re (IGNORECASE) iguala a letras ASCII;
+# convertidos antes de comparar a mensagem com literais ASCII
+_ASCII_FOLDS = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+
+def _extract_literals(pattern: str) -> Optional[List[str]]:
+    """
+    Extrai um literal obrigatório de cada alternativa do padrão.
+    
+    Só entende padrões simples (alternativas de literais separados por
+    curingas como ".*"), sem flags inline além de "(?i)". Retorna None
+    quando o padrão não é simples o bastante para ser pré-filtrado com
+    segurança. Só trechos ASCII são usados: a comparação em minúsculas
+    não acompanha o case folding do re fora do ASCII.
+    
+    Args:
+        pattern: Padrão regex
+        
+    Returns:
+        Lista de literais em minúsculas ou None
+    """
+    flags, pattern = _split_global_flags(pattern)
+    if flags.replace('i', ''):
+        return None  # Ex: "(?x)" muda o significado dos espaços
+    
+    literals = []
+    for alternative in pattern.split('|'):
+        segments = _WILDCARD_RE.split(alternative)
+        if any(char in _METACHARS for segment in segments for char in segment):
+            return None
+        
+        runs = [run for segment in segments for run in _ASCII_RUN_RE.findall(segment)]
+        if not runs:
+            return None
+        literals.append(max(runs, key=len).lower())
+    
+    return literals
+
 
 class AutoResponsePlugin(BasePlugin):
     """
@@ -24,6 +147,13 @@ class AutoResponsePlugin(BasePlugin):
     - Blacklist de players
     """
     
+    __slots__ = (
+        'last_response_time', '_searches', '_replies', '_pattern_indexes', '_master_pattern',
+        '_group_positions', '_unmerged', '_literal_triggers', '_pattern_count', '_templated_replies', '_prescreen', '_rng',
+        '_blacklist_lower', '_cooldown_ns', '_channel_enabled',
+        '_batch_messages', '_pending', '_clock_second', '_time_str', '_date_str'
+    )
+    
     def _setup_plugin_info(self) -> None:
         """Configura informações do plugin."""
         self.info = PluginInfo(
@@ -48,6 +178,8 @@ class AutoResponsePlugin(BasePlugin):
             'respond_to_guild': False,
             'respond_to_party': False,
             'blacklist': [],
+            'use_re2': True,  # Usa RE2 quando instalado
+            'batch_messages': False,  # Processa mensagens em lote a cada timer_tick
             'responses': {
                 r'(?i)hi|hello|oi|olá': ['Hi there!', 'Hello!', 'Oi!'],
                 r'(?i)how are you|como vai': ['I\'m fine, thanks!', 'Estou bem, obrigado!'],
@@ -57,91 +189,250 @@ class AutoResponsePlugin(BasePlugin):
         })
         
         # Estado interno
-        self.last_response_time: Dict[str, float] = {}
-        self.response_patterns: List[tuple] = []
+        # Último envio por jogador, em ns do relógio monotônico,
+        # ordenado do mais antigo para o mais recente
+        self.last_response_time: OrderedDict[str, int] = OrderedDict()
+        # Padrões e respostas em listas paralelas (mesmo índice), com a
+        # posição de cada padrão na configuração
+        self._searches: List[Callable] = []
+        self._replies: List[Union[str, tuple]] = []
+        self._pattern_indexes: List[int] = []
+        self._master_pattern: Optional[re.Pattern] = None
+        self._group_positions: Dict[str, int] = {}
+        # Posições dos padrões fora da alternação (referências a grupos)
+        self._unmerged: List[int] = []
+        # (posição na configuração, palavra, respostas), em ordem de configuração
+        self._literal_triggers: List[Tuple[int, str, Union[str, tuple]]] = []
+        self._pattern_count = 0
+        self._templated_replies: frozenset = frozenset()
+        self._prescreen = None
+        self._rng = random.Random()
+        
+        # Caches de configuração usados no caminho quente
+        self._blacklist_lower: set = set()
+        self._cooldown_ns: int = 5 * 1_000_000_000
+        self._channel_enabled: Dict[str, bool] = {}
+        self._batch_messages = False
+        
+        # Mensagens aguardando o próximo timer_tick (modo em lote)
+        self._pending: deque = deque()
+        
+        # Hora/data formatadas, recalculadas no máximo uma vez por segundo
+        self._clock_second = -1
+        self._time_str = ''
+        self._date_str = ''
     
     def on_load(self) -> bool:
         """Carrega o plugin."""
         self._compile_patterns()
+        self._rebuild_blacklist_cache()
+        self._update_cooldown(self.config.get('cooldown', 5))
+        self._refresh_channels()
+        self._batch_messages = bool(self.config.get('batch_messages', False))
         return True
     
     def on_activate(self) -> bool:
         """Ativa o plugin."""
         # Registra handlers de eventos
-        self.add_event_handler('chat_message', self._handle_chat_message)
-        self.add_event_handler('private_message', self._handle_private_message)
-        self.add_event_handler('guild_message', self._handle_guild_message)
-        self.add_event_handler('party_message', self._handle_party_message)
+        for chat_type, (event_name, _, _) in _CHANNELS.items():
+            self.add_event_handler(event_name, partial(self._handle_message, chat_type))
+        
+        self.add_event_handler('timer_tick', self._handle_timer_tick)
         
         self.logger.info("AutoResponse ativado")
         return True
     
     def on_deactivate(self) -> None:
         """Desativa o plugin."""
+        self._pending.clear()
         self.logger.info("AutoResponse desativado")
     
     def on_config_changed(self, key: str, old_value: Any, new_value: Any) -> None:
         """Chamado quando configuração muda."""
-        if key == 'responses':
+        if key in ('responses', 'use_re2'):
             self._compile_patterns()
+        elif key == 'blacklist':
+            self._rebuild_blacklist_cache()
+        elif key == 'cooldown':
+            self._update_cooldown(new_value)
+        elif key.startswith('respond_to_'):
+            self._refresh_channels()
+        elif key == 'batch_messages':
+            self._batch_messages = bool(new_value)
+            if not self._batch_messages:
+                self._drain_pending()
+    
+    def _refresh_channels(self) -> None:
+        """Atualiza cache de canais habilitados."""
+        self._channel_enabled = {
+            chat_type: bool(self.config.get(config_key, default))
+            for chat_type, (_, config_key, default) in _CHANNELS.items()
+        }
+    
+    def _update_cooldown(self, cooldown: float) -> None:
+        """Atualiza cooldown em cache (segundos -> nanossegundos)."""
+        self._cooldown_ns = int(cooldown * 1_000_000_000)
+    
+    def _rebuild_blacklist_cache(self) -> None:
+        """Recalcula o conjunto de nomes da blacklist em minúsculas."""
+        self._blacklist_lower = {
+            name.lower() for name in self.config.get('blacklist', [])
+        }
     
     def _compile_patterns(self) -> None:
-        """Compila padrões regex."""
-        self.response_patterns = []
+        """
+        Compila padrões regex.
+        
+        Padrões case-insensitive formados só por palavras (ex: "(?i)hi|oi")
+        viram gatilhos literais, buscados como substring da mensagem em
+        minúsculas (mesma semântica do regex, sem o motor de regex).
+        Os demais são combinados em uma única alternação com grupos
+        nomeados, compilada com "(?i)" global, permitindo uma só busca
+        por mensagem. Padrões sem "(?i)" continuam case-sensitive.
+        Padrões com referências a grupos (ex: "(\\w)\\1") ficam fora da
+        alternação, onde a numeração dos grupos mudaria, e são testados
+        isoladamente.
+        """
+        self._searches = []
+        self._replies = []
+        self._pattern_indexes = []
+        self._group_positions = {}
+        self._unmerged = []
+        self._literal_triggers = []
+        self._pattern_count = 0
+        templated = set()
+        self._master_pattern = None
+        self._prescreen = None
         
+        parts = []
+        literals: Optional[List[str]] = [] if ahocorasick is not None else None
         responses = self.config.get('responses', {})
-        for pattern, reply_list in responses.items():
+        for index, (pattern, reply_list) in enumerate(responses.items()):
+            # Valida cada padrão isoladamente para não invalidar os demais
             try:
-                compiled_pattern = re.compile(pattern)
-                self.response_patterns.append((compiled_pattern, reply_list))
+                compiled_pattern = self._compile_regex(pattern)
             except re.error as e:
                 self.logger.error(f"Padrão regex inválido '{pattern}': {e}")
-    
-    def _handle_chat_message(self, event_data: Dict[str, Any]) -> None:
-        """Processa mensagem do chat público."""
-        if not self.config.get('respond_to_public', True):
+                continue
+            
+            self._pattern_count += 1
+            
+            # Resposta única fica como string e dispensa o sorteio
+            replies = reply_list[0] if len(reply_list) == 1 else tuple(reply_list)
+            
+            # Respostas sem variáveis dispensam formatação
+            templated.update(reply for reply in reply_list if _VAR_RE.search(reply))
+            
+            # Um único padrão sem literal obrigatório desativa o pré-filtro
+            if literals is not None:
+                pattern_literals = _extract_literals(pattern)
+                literals = literals + pattern_literals if pattern_literals else None
+            
+            literal_match = _LITERAL_WORDS_RE.fullmatch(pattern)
+            if literal_match:
+                for word in literal_match.group(1).lower().split('|'):
+                    self._literal_triggers.append((index, word, replies))
+                continue
+            
+            self._searches.append(compiled_pattern.search)
+            self._replies.append(replies)
+            
+            self._pattern_indexes.append(index)
+            
+            # Os grupos do padrão são renumerados dentro da alternação
+            if _GROUP_REF_RE.search(pattern):
+                self._unmerged.append(len(self._searches) - 1)
+                continue
+            
+            group_name = f"ar_{index}"
+            parts.append(f"(?P<{group_name}>{_fold_case_flag(pattern)})")
+            self._group_positions[group_name] = len(self._searches) - 1
+        
+        self._templated_replies = frozenset(templated)
+        
+        if literals:
+            self._prescreen = ahocorasick.Automaton()
+            for literal in literals:
+                self._prescreen.add_word(literal, literal)
+            self._prescreen.make_automaton()
+        
+        if not parts:
             return
         
-        self._process_message(
-            event_data.get('message', ''),
-            event_data.get('player', ''),
-            'public'
-        )
+        try:
+            # Flag case-insensitive aplicada uma vez para toda a alternação
+            self._master_pattern = self._compile_regex('(?i)' + '|'.join(parts))
+        except re.error as e:
+            # Ex: grupos nomeados repetidos entre padrões
+            self.logger.warning(f"Falha ao combinar padrões, usando busca sequencial: {e}")
     
-    def _handle_private_message(self, event_data: Dict[str, Any]) -> None:
-        """Processa mensagem privada."""
-        if not self.config.get('respond_to_pm', True):
-            return
+    def _compile_regex(self, pattern: str):
+        """
+        Compila padrão, preferindo RE2 quando disponível.
         
-        self._process_message(
-            event_data.get('message', ''),
-            event_data.get('player', ''),
-            'private'
-        )
+        Padrões que o RE2 não suporta (ex: backreferences) caem
+        para o módulo re apenas para aquele padrão.
+        
+        Raises:
+            re.error: Se o padrão for inválido
+        """
+        if re2 is not None and self.config.get('use_re2', True):
+            try:
+                return re2.compile(pattern)
+            except re2.error as e:
+                self.logger.warning(f"Padrão não suportado pelo RE2, usando re: '{pattern}' ({e})")
+        
+        return re.compile(pattern)
     
-    def _handle_guild_message(self, event_data: Dict[str, Any]) -> None:
-        """Processa mensagem da guild."""
-        if not self.config.get('respond_to_guild', False):
+    def _handle_message(self, chat_type: str, event_data: Dict[str, Any]) -> None:
+        """
+        Processa mensagem de qualquer canal de chat.
+        
+        Args:
+            chat_type: Tipo do chat (public, private, guild, party)
+            event_data: Dados do evento
+        """
+        if not self._channel_enabled.get(chat_type):
             return
         
-        self._process_message(
-            event_data.get('message', ''),
-            event_data.get('player', ''),
-            'guild'
-        )
-    
-    def _handle_party_message(self, event_data: Dict[str, Any]) -> None:
-        """Processa mensagem do party."""
-        if not self.config.get('respond_to_party', False):
+        try:
+            message = event_data['message']
+            player = event_data['player']
+        except KeyError as e:
+            self.logger.warning(f"Evento de chat malformado, campo ausente: {e}")
             return
         
-        self._process_message(
-            event_data.get('message', ''),
-            event_data.get('player', ''),
-            'party'
-        )
+        if self._batch_messages:
+            # Guarda o horário de chegada para o cooldown
+            self._pending.append((message, player, chat_type, time.monotonic_ns()))
+            return
+        
+        self._process_message(message, player, chat_type)
+    
+    def _handle_timer_tick(self, event_data: Dict[str, Any]) -> None:
+        """Processa tick do timer."""
+        if self._pending:
+            self._drain_pending()
+    
+    def _drain_pending(self) -> None:
+        """
+        Processa mensagens acumuladas no modo em lote.
+        
+        Cada jogador recebe no máximo uma resposta por lote.
+        """
+        pending = self._pending
+        answered = set()
+        
+        while pending:
+            message, player, chat_type, received_at = pending.popleft()
+            if player in answered:
+                continue
+            
+            if self._process_message(message, player, chat_type, received_at):
+                answered.add(player)
     
-    def _process_message(self, message: str, player: str, chat_type: str) -> None:
+    def _process_message(self, message: str, player: str, chat_type: str,
+                         current_time: Optional[int] = None) -> bool:
         """
         Processa mensagem e responde se necessário.
         
@@ -149,42 +440,123 @@ class AutoResponsePlugin(BasePlugin):
             message: Mensagem recebida
             player: Nome do jogador
             chat_type: Tipo do chat
+            current_time: Horário da mensagem (ns monotônico), padrão agora
+            
+        Returns:
+            True se uma resposta foi enviada
         """
         if not message or not player:
-            return
+            return False
         
         # Verifica blacklist
-        blacklist = self.config.get('blacklist', [])
-        if player.lower() in [name.lower() for name in blacklist]:
-            return
+        if player.lower() in self._blacklist_lower:
+            return False
         
         # Verifica cooldown
-        cooldown = self.config.get('cooldown', 5)
-        current_time = time.time()
-        
-        if player in self.last_response_time:
-            if current_time - self.last_response_time[player] < cooldown:
-                return
-        
-        # Procura padrão correspondente
-        for pattern, replies in self.response_patterns:
-            match = pattern.search(message)
-            if match:
-                # Seleciona resposta
-                import random
-                reply = random.choice(replies)
-                
-                # Substitui variáveis
-                reply = self._format_response(reply, player, chat_type)
-                
-                # Envia resposta
-                self._send_response(reply, player, chat_type)
-                
-                # Atualiza cooldown
-                self.last_response_time[player] = current_time
-                
-                self.logger.debug(f"Auto-resposta para {player}: {reply}")
+        if current_time is None:
+            current_time = time.monotonic_ns()
+        
+        last_time = self.last_response_time.get(player)
+        if last_time is not None and current_time - last_time < self._cooldown_ns:
+            return False
+        
+        message_lower = (message if message.isascii() else message.translate(_ASCII_FOLDS)).lower()
+        
+        # Pré-filtro: sem nenhum literal presente, nenhum padrão casa
+        prescreen = self._prescreen
+        if prescreen is not None:
+            if next(prescreen.iter(message_lower), None) is None:
+                return False
+        
+        # Vale o padrão que casa e vem primeiro na configuração
+        
+        # Gatilhos literais, em ordem de configuração: o primeiro presente
+        # é o de menor posição entre eles
+        replies = None
+        searches = self._searches
+        limit = len(searches)
+        for index, word, word_replies in self._literal_triggers:
+            if word in message_lower:
+                replies = word_replies
+                # Só padrões regex anteriores a ele ainda podem vencer
+                limit = bisect_left(self._pattern_indexes, index)
                 break
+        
+        # Procura padrão regex correspondente
+        if limit:
+            found = None
+            master_pattern = self._master_pattern
+            if master_pattern is not None:
+                match = master_pattern.search(message)
+                if match:
+                    hit = self._group_positions[match.lastgroup]
+                    # A alternação acha o casamento mais à esquerda, mas os
+                    # padrões anteriores ainda podem casar mais adiante
+                    for position in range(min(hit, limit)):
+                        if searches[position](message):
+                            found = position
+                            break
+                    else:
+                        if hit < limit:
+                            found = hit
+                else:
+                    # Só os padrões fora da alternação ainda podem casar
+                    for position in self._unmerged:
+                        if position >= limit:
+                            break
+                        if searches[position](message):
+                            found = position
+                            break
+            else:
+                for position in range(limit):
+                    if searches[position](message):
+                        found = position
+                        break
+            
+            if found is not None:
+                replies = self._replies[found]
+        
+        if replies is None:
+            return False
+        
+        # Seleciona resposta
+        reply = replies if isinstance(replies, str) else self._rng.choice(replies)
+        
+        # Substitui variáveis
+        if reply in self._templated_replies:
+            reply = self._format_response(reply, player, chat_type)
+        
+        # Envia resposta
+        self._send_response(reply, player, chat_type)
+        
+        # Atualiza cooldown
+        self._touch_response_time(player, current_time)
+        
+        self.logger.debug(f"Auto-resposta para {player}: {reply}")
+        return True
+    
+    def _touch_response_time(self, player: str, current_time: int) -> None:
+        """
+        Registra resposta para o jogador e descarta entradas antigas.
+        
+        Entradas cujo cooldown já expirou não afetam mais nada, e como o
+        dicionário é mantido em ordem de uso elas ficam sempre no início.
+        
+        Args:
+            player: Nome do jogador
+            current_time: Timestamp monotônico em ns
+        """
+        last_times = self.last_response_time
+        cooldown_ns = self._cooldown_ns
+        last_times[player] = current_time
+        last_times.move_to_end(player)
+        
+        while len(last_times) > 1:
+            oldest_time = next(iter(last_times.values()))
+            if (current_time - oldest_time < cooldown_ns
+                    and len(last_times) <= _MAX_TRACKED_PLAYERS):
+                break
+            last_times.popitem(last=False)
     
     def _format_response(self, response: str, player: str, chat_type: str) -> str:
         """
@@ -198,21 +570,41 @@ class AutoResponsePlugin(BasePlugin):
         Returns:
             Resposta formatada
         """
-        # Variáveis disponíveis
+        # Variáveis disponíveis, avaliadas só se aparecerem no template
         variables = {
-            'player': player,
-            'chat_type': chat_type,
-            'level': self._get_character_level(),
-            'map': self._get_current_map(),
-            'time': time.strftime('%H:%M:%S'),
-            'date': time.strftime('%d/%m/%Y')
+            'player': lambda: player,
+            'chat_type': lambda: chat_type,
+            'level': self._get_character_level,
+            'map': self._get_current_map,
+            'time': lambda: self._get_clock_strings()[0],
+            'date': lambda: self._get_clock_strings()[1]
         }
         
-        # Substitui variáveis
-        for var, value in variables.items():
-            response = response.replace(f'{{{var}}}', str(value))
+        get_variable = variables.get
+        
+        def substitute(match: re.Match) -> str:
+            getter = get_variable(match.group(1))
+            return str(getter()) if getter else match.group(0)
+        
+        # Substitui variáveis em uma única passada
+        return _VAR_RE.sub(substitute, response)
+    
+    def _get_clock_strings(self) -> tuple:
+        """
+        Obtém hora e data formatadas para o segundo atual.
         
-        return response
+        Returns:
+            Tupla (hora, data)
+        """
+        now = time.time()
+        second = int(now)
+        if second != self._clock_second:
+            local_time = time.localtime(now)
+            self._time_str = time.strftime('%H:%M:%S', local_time)
+            self._date_str = time.strftime('%d/%m/%Y', local_time)
+            self._clock_second = second
+        
+        return self._time_str, self._date_str
     
     def _get_character_level(self) -> str:
         """Obtém level do personagem."""
@@ -258,7 +650,7 @@ class AutoResponsePlugin(BasePlugin):
         """
         try:
             # Testa padrão
-            re.compile(pattern)
+            self._compile_regex(pattern)
             
             # Adiciona à configuração
             responses = self.config.get('responses', {})
@@ -299,23 +691,32 @@ class AutoResponsePlugin(BasePlugin):
     
     def add_to_blacklist(self, player: str) -> None:
         """Adiciona jogador à blacklist."""
+        player_lower = player.lower()
+        if player_lower in self._blacklist_lower:
+            return
+        
         blacklist = self.config.get('blacklist', [])
-        if player.lower() not in [name.lower() for name in blacklist]:
-            blacklist.append(player)
-            self.config.set('blacklist', blacklist)
-            self.logger.info(f"Jogador adicionado à blacklist: {player}")
+        blacklist.append(player)
+        self.config.set('blacklist', blacklist)
+        self._blacklist_lower.add(player_lower)
+        self.logger.info(f"Jogador adicionado à blacklist: {player}")
     
     def remove_from_blacklist(self, player: str) -> None:
         """Remove jogador da blacklist."""
+        player_lower = player.lower()
+        if player_lower not in self._blacklist_lower:
+            return
+        
         blacklist = self.config.get('blacklist', [])
-        blacklist = [name for name in blacklist if name.lower() != player.lower()]
+        blacklist = [name for name in blacklist if name.lower() != player_lower]
         self.config.set('blacklist', blacklist)
+        self._blacklist_lower.discard(player_lower)
         self.logger.info(f"Jogador removido da blacklist: {player}")
     
     def get_statistics(self) -> Dict[str, Any]:
         """Obtém estatísticas do plugin."""
         return {
-            'total_patterns': len(self.response_patterns),
+            'total_patterns': self._pattern_count,
             'blacklist_size': len(self.config.get('blacklist', [])),
             'recent_responses': len(self.last_response_time),
             'config': {
@@ -6,20 +6,74 @@ Plugin para registrar drops, loots e transações de itens.
 Similar ao itemsGather do OpenKore.
 """
 
+import heapq
+import mmap
+import os
+import queue
+import sys
+import threading
 import time
 import json
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Any, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from base_plugin import BasePlugin, PluginInfo, PluginType
 
+# orjson é opcional: (de)serialização em C, bem mais rápida que json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _dump_json(data: Any, indent: bool = True) -> bytes:
+    """Serializa dados do log para JSON em UTF-8 (indentado por padrão)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Dict[str, Any]:
+    """Desserializa JSON do log."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Início da lista de eventos no arquivo de log; cada evento ocupa uma linha
+_EVENTS_HEADER = b',\n"events": ['
+
+
+# Diferença entre relógio de parede e monotônico, em nanossegundos.
+# Converte timestamps monotônicos dos eventos para horário real.
+_EPOCH_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Interna nomes (itens, mapas, monstros...): uma cópia por valor distinto."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+@dataclass(slots=True)
 class ItemEvent:
-    """Evento de item."""
-    timestamp: float
+    """
+    Evento de item (com __slots__: sem __dict__ por instância).
+    
+    timestamp_ns vem de time.monotonic_ns(): inteiro, imune a ajustes
+    do relógio do sistema. O horário real é obtido somando _EPOCH_NS.
+    """
+    timestamp_ns: int
     event_type: str  # drop, pickup, sold, bought, traded, etc.
     item_name: str
     item_id: int
@@ -31,9 +85,308 @@ class ItemEvent:
     player_name: Optional[str] = None
     price: Optional[int] = None
     
+    # Colunas de exportação, na ordem de as_row()
+    _fields = (
+        'timestamp', 'event_type', 'item_name', 'item_id', 'quantity', 'map_name',
+        'coordinates', 'monster_name', 'npc_name', 'player_name', 'price'
+    )
+    
+    @property
+    def timestamp(self) -> float:
+        """Horário real do evento, em segundos (como time.time())."""
+        return (self.timestamp_ns + _EPOCH_NS) / 1e9
+    
+    def as_row(self) -> tuple:
+        """Valores do evento na ordem de _fields (timestamp em horário real)."""
+        return (
+            self.timestamp, self.event_type, self.item_name, self.item_id,
+            self.quantity, self.map_name, self.coordinates, self.monster_name,
+            self.npc_name, self.player_name, self.price
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converte para dicionário, com timestamp em horário real.
+        
+        Mantém exatamente os campos do formato anterior, para que versões
+        antigas (ItemEvent(**dados)) continuem lendo os logs salvos.
+        """
+        return dict(zip(self._fields, self.as_row()))
+    
+    @classmethod
+    def from_wall_time(cls, timestamp: float, **fields: Any) -> 'ItemEvent':
+        """
+        Cria evento a partir do horário real (como o antigo ItemEvent(timestamp=...)).
+        
+        Args:
+            timestamp: Horário real em segundos (como time.time())
+            **fields: Demais campos do evento
+        """
+        return cls(timestamp_ns=int(timestamp * 1e9) - _EPOCH_NS, **fields)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ItemEvent':
+        """Cria evento a partir do dicionário salvo (aceita timestamp_ns, se presente)."""
+        data = dict(data)
+        wall_s = data.pop('timestamp', 0.0)
+        wall_ns = data.pop('timestamp_ns', None)
+        if wall_ns is None:
+            return cls.from_wall_time(wall_s, **data)
+        return cls(timestamp_ns=wall_ns - _EPOCH_NS, **data)
+
+
+@dataclass(slots=True)
+class SessionStats:
+    """Estatísticas da sessão (contadores atualizados a cada evento)."""
+    drops_count: int = 0
+    pickups_count: int = 0
+    sales_count: int = 0
+    purchases_count: int = 0
+    trades_count: int = 0
+    total_zeny_gained: int = 0
+    total_zeny_spent: int = 0
+    unique_items: set = field(default_factory=set)
+    monsters_killed: Counter = field(default_factory=Counter)
+    maps_visited: set = field(default_factory=set)
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Converte para dicionário."""
-        return asdict(self)
+        """Converte para dicionário serializável (cópia)."""
+        return {
+            'drops_count': self.drops_count,
+            'pickups_count': self.pickups_count,
+            'sales_count': self.sales_count,
+            'purchases_count': self.purchases_count,
+            'trades_count': self.trades_count,
+            'total_zeny_gained': self.total_zeny_gained,
+            'total_zeny_spent': self.total_zeny_spent,
+            'unique_items': list(self.unique_items),
+            'monsters_killed': dict(self.monsters_killed),
+            'maps_visited': list(self.maps_visited)
+        }
+
+
+def _decrement(counter: Counter, key: Any) -> bool:
+    """Decrementa contagem, removendo a chave ao zerar. Retorna True se removeu."""
+    count = counter[key] - 1
+    if count:
+        counter[key] = count
+        return False
+    del counter[key]
+    return True
+
+
+class ItemEventColumns:
+    """
+    Armazenamento colunar (SoA) dos eventos de item.
+    
+    Cada campo de ItemEvent vira uma coluna: campos numéricos ficam em
+    array.array e o tipo do evento é guardado como código inteiro.
+    Nomes são internados na inserção (sys.intern), pois se repetem muito.
+    Instâncias de ItemEvent só são criadas quando consultadas.
+    
+    As colunas são pré-alocadas e usadas como ring buffer: ao atingir a
+    capacidade, cada novo evento sobrescreve o mais antigo em O(1).
+    Índices recebidos/retornados pelos métodos são slots físicos.
+    
+    Agregados por tipo/item/monstro/mapa são mantidos a cada inserção e
+    descontados quando o ring buffer descarta um evento.
+    """
+    
+    # Colunas por evento (atributos com um valor por slot)
+    _COLUMNS = (
+        'timestamps_ns', 'type_codes', 'item_ids', 'quantities', 'item_names', 'map_names',
+        'coordinates', 'monster_names', 'npc_names', 'player_names', 'prices'
+    )
+    
+    def __init__(self, capacity: int):
+        # Tipo de evento <-> código
+        self.type_names: List[str] = []
+        self.type_code_by_name: Dict[str, int] = {}
+        
+        self._allocate(capacity)
+    
+    def _allocate(self, capacity: int) -> None:
+        """Cria colunas vazias com a capacidade informada."""
+        self.capacity = max(1, capacity)
+        self._start = 0  # Slot do evento mais antigo
+        self._count = 0
+        
+        # Agregados dos eventos presentes
+        self.type_counts: Counter = Counter()  # Código do tipo -> eventos
+        self.item_counts: Counter = Counter()
+        self.item_quantities: Counter = Counter()
+        self.monster_drops: Counter = Counter()  # Apenas drops com monstro
+        self.map_counts: Counter = Counter()
+        
+        size = self.capacity
+        self.timestamps_ns = array('q', [0]) * size
+        self.type_codes = array('B', [0]) * size
+        self.item_ids = array('q', [0]) * size
+        self.quantities = array('q', [0]) * size
+        self.item_names: List[str] = [''] * size
+        self.map_names: List[str] = [''] * size
+        self.coordinates: List[tuple] = [()] * size
+        self.monster_names: List[Optional[str]] = [None] * size
+        self.npc_names: List[Optional[str]] = [None] * size
+        self.player_names: List[Optional[str]] = [None] * size
+        self.prices: List[Optional[int]] = [None] * size
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def _segments(self) -> List[tuple]:
+        """Intervalos de slots (início, fim) em ordem cronológica."""
+        end = self._start + self._count
+        if end <= self.capacity:
+            return [(self._start, end)]
+        return [(self._start, self.capacity), (0, end - self.capacity)]
+    
+    def slots(self) -> Iterable[int]:
+        """Slots ocupados, do evento mais antigo para o mais recente."""
+        return chain.from_iterable(range(lo, hi) for lo, hi in self._segments())
+    
+    def ordered(self, column) -> Iterable:
+        """Valores ocupados da coluna, em ordem cronológica."""
+        return chain.from_iterable(column[lo:hi] for lo, hi in self._segments())
+    
+    def slots_in_timerange(self, start_ns: int, end_ns: int) -> Iterable[int]:
+        """
+        Slots com start_ns <= timestamp_ns <= end_ns (relógio monotônico).
+        
+        Eventos são adicionados em ordem cronológica, então cada segmento
+        do ring buffer está ordenado e pode ser filtrado por busca binária.
+        """
+        timestamps = self.timestamps_ns
+        for lo, hi in self._segments():
+            first = bisect_left(timestamps, start_ns, lo, hi)
+            last = bisect_right(timestamps, end_ns, first, hi)
+            yield from range(first, last)
+    
+    def get_type_code(self, event_type: str) -> int:
+        """Obtém código do tipo de evento, registrando tipos novos."""
+        code = self.type_code_by_name.get(event_type)
+        if code is None:
+            code = len(self.type_names)
+            self.type_names.append(event_type)
+            self.type_code_by_name[event_type] = code
+        return code
+    
+    def append(self, event: ItemEvent) -> None:
+        """
+        Adiciona evento, sobrescrevendo o mais antigo se cheio.
+        
+        Campos numéricos ausentes (None) viram 0 e os demais são convertidos
+        para int antes de alterar o ring buffer: um valor inválido levanta
+        TypeError/ValueError/OverflowError sem deixar slot pela metade.
+        """
+        timestamp_ns = int(event.timestamp_ns)
+        item_id = int(event.item_id or 0)
+        quantity = int(event.quantity or 0)
+        array('q', (timestamp_ns, item_id, quantity))  # Valida o limite de 64 bits
+        code = self.get_type_code(event.event_type)
+        
+        if self._count < self.capacity:
+            slot = self._start + self._count
+            if slot >= self.capacity:
+                slot -= self.capacity
+            self._count += 1
+        else:
+            slot = self._start
+            self._start = slot + 1 if slot + 1 < self.capacity else 0
+            self._discount(slot)
+        
+        item_name = _intern(event.item_name)
+        map_name = _intern(event.map_name)
+        monster_name = _intern(event.monster_name)
+        
+        self.timestamps_ns[slot] = timestamp_ns
+        self.type_codes[slot] = code
+        self.item_ids[slot] = item_id
+        self.quantities[slot] = quantity
+        self.item_names[slot] = item_name
+        self.map_names[slot] = map_name
+        self.coordinates[slot] = event.coordinates
+        self.monster_names[slot] = monster_name
+        self.npc_names[slot] = _intern(event.npc_name)
+        self.player_names[slot] = _intern(event.player_name)
+        self.prices[slot] = event.price
+        
+        self.type_counts[code] += 1
+        self.item_counts[item_name] += 1
+        self.item_quantities[item_name] += quantity
+        if monster_name and event.event_type == 'drop':
+            self.monster_drops[monster_name] += 1
+        self.map_counts[map_name] += 1
+    
+    def _discount(self, slot: int) -> None:
+        """Remove dos agregados o evento do slot (antes de sobrescrevê-lo)."""
+        code = self.type_codes[slot]
+        _decrement(self.type_counts, code)
+        
+        item_name = self.item_names[slot]
+        if _decrement(self.item_counts, item_name):
+            del self.item_quantities[item_name]
+        else:
+            self.item_quantities[item_name] -= self.quantities[slot]
+        
+        monster_name = self.monster_names[slot]
+        if monster_name and self.type_names[code] == 'drop':
+            _decrement(self.monster_drops, monster_name)
+        
+        _decrement(self.map_counts, self.map_names[slot])
+    
+    def get(self, slot: int) -> ItemEvent:
+        """Materializa o evento do slot informado."""
+        return ItemEvent(
+            timestamp_ns=self.timestamps_ns[slot],
+            event_type=self.type_names[self.type_codes[slot]],
+            item_name=self.item_names[slot],
+            item_id=self.item_ids[slot],
+            quantity=self.quantities[slot],
+            map_name=self.map_names[slot],
+            coordinates=self.coordinates[slot],
+            monster_name=self.monster_names[slot],
+            npc_name=self.npc_names[slot],
+            player_name=self.player_names[slot],
+            price=self.prices[slot]
+        )
+    
+    def select(self, slots: Iterable[int]) -> List[ItemEvent]:
+        """Materializa os eventos dos slots informados."""
+        return [self.get(slot) for slot in slots]
+    
+    def resize(self, capacity: int) -> None:
+        """Altera a capacidade mantendo os eventos mais recentes."""
+        events = self.select(self.slots())
+        self._allocate(capacity)
+        for event in events:
+            self.append(event)
+    
+    def clear(self) -> None:
+        """Remove todos os eventos."""
+        self._allocate(self.capacity)
+    
+    def snapshot(self) -> 'ItemEventColumns':
+        """
+        Cópia independente dos eventos, em ordem cronológica a partir do slot 0.
+        
+        Copia só as colunas (fatias de array/lista), sem materializar
+        ItemEvent; os agregados da cópia ficam vazios.
+        """
+        copy = ItemEventColumns(0)
+        copy.type_names = self.type_names[:]
+        copy.type_code_by_name = dict(self.type_code_by_name)
+        if self._count:
+            segments = self._segments()
+            for name in self._COLUMNS:
+                column = getattr(self, name)
+                lo, hi = segments[0]
+                ordered = column[lo:hi]
+                for lo, hi in segments[1:]:
+                    ordered += column[lo:hi]
+                setattr(copy, name, ordered)
+            copy.capacity = copy._count = self._count
+        return copy
 
 
 class ItemLoggerPlugin(BasePlugin):
@@ -86,26 +439,37 @@ class ItemLoggerPlugin(BasePlugin):
         })
         
         # Estado interno
-        self.item_events: List[ItemEvent] = []
+        self._event_store = ItemEventColumns(self.config.get('max_log_size', 10000))
+        # Log em disco mapeado, com eventos ainda não carregados: (mmap, offset)
+        self._pending_log: Optional[tuple] = None
+        
+        # Índices invertidos (chave -> slots), reconstruídos sob demanda
+        self._idx_by_type: Dict[str, List[int]] = {}
+        self._idx_by_item: Dict[str, List[int]] = {}
+        self._idx_by_monster: Dict[str, List[int]] = {}
+        self._idx_by_map: Dict[str, List[int]] = {}
+        self._indexes_dirty = True
+        
+        # Configurações usadas a cada evento, em cache como atributos
+        self._refresh_config_cache()
+        
+        # Gravação do log em thread separada (snapshots enfileirados)
+        self._save_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        # Há alterações ainda não salvas? (autosave é pulado se não houver)
+        self._log_dirty = False
+        
         self.session_start: float = time.time()
+        self._session_start_iso = datetime.fromtimestamp(self.session_start).isoformat()
         self.last_save: float = time.time()
         
         # Estatísticas da sessão
-        self.session_stats = {
-            'drops_count': 0,
-            'pickups_count': 0,
-            'sales_count': 0,
-            'purchases_count': 0,
-            'trades_count': 0,
-            'total_zeny_gained': 0,
-            'total_zeny_spent': 0,
-            'unique_items': set(),
-            'monsters_killed': {},
-            'maps_visited': set()
-        }
+        self.session_stats = SessionStats()
     
     def on_load(self) -> bool:
         """Carrega o plugin."""
+        self._refresh_config_cache()
+        
         # Carrega log existente
         self._load_log_file()
         return True
@@ -131,133 +495,153 @@ class ItemLoggerPlugin(BasePlugin):
         """Desativa o plugin."""
         # Salva dados antes de desativar
         self._save_log_file()
+        self._flush_saves()
         self.logger.info("ItemLogger desativado")
     
+    def on_unload(self) -> None:
+        """Descarrega o plugin."""
+        # Encerra a thread de gravação após as gravações pendentes
+        if self._writer_thread is not None:
+            self._save_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+        self._close_pending_log()
+    
+    def on_config_changed(self, key: str, old_value: Any, new_value: Any) -> None:
+        """Chamado quando configuração muda."""
+        self._refresh_config_cache()
+    
+    def _refresh_config_cache(self) -> None:
+        """Recalcula configurações em cache a partir da configuração."""
+        get = self.config.get
+        
+        self._log_drops = get('log_drops', True)
+        self._log_pickups = get('log_pickups', True)
+        self._log_sales = get('log_sales', True)
+        self._log_purchases = get('log_purchases', True)
+        self._log_trades = get('log_trades', True)
+        self._auto_save_interval = get('auto_save_interval', 300)
+        self._max_log_size = get('max_log_size', 10000)
+        
+        # Filtros de item
+        self._blacklist_lc = frozenset(item.lower() for item in get('blacklist_items', []))
+        self._whitelist_lc = frozenset(item.lower() for item in get('whitelist_items', []))
+        self._filter_worthless = get('filter_worthless', False)
+        self._min_item_value = get('min_item_value', 0)
+    
+    @staticmethod
+    def _build_item_event(event_type: str, event_data: Dict[str, Any], **extra: Any) -> ItemEvent:
+        """
+        Monta ItemEvent com os campos comuns a todos os eventos de item.
+        
+        Args:
+            event_type: Tipo do evento (drop, pickup, sold...)
+            event_data: Dados recebidos do evento
+            **extra: Campos específicos do tipo (monster_name, price...)
+        """
+        get = event_data.get
+        return ItemEvent(
+            timestamp_ns=time.monotonic_ns(),
+            event_type=event_type,
+            item_name=get('item_name', ''),
+            item_id=get('item_id', 0),
+            quantity=get('quantity', 1),
+            map_name=get('map_name', ''),
+            coordinates=get('coordinates', (0, 0)),
+            **extra
+        )
+    
     def _handle_item_dropped(self, event_data: Dict[str, Any]) -> None:
         """Processa drop de item."""
-        if not self.config.get('log_drops', True):
+        if not self._log_drops:
             return
         
-        item_event = ItemEvent(
-            timestamp=time.time(),
-            event_type='drop',
-            item_name=event_data.get('item_name', ''),
-            item_id=event_data.get('item_id', 0),
-            quantity=event_data.get('quantity', 1),
-            map_name=event_data.get('map_name', ''),
-            coordinates=event_data.get('coordinates', (0, 0)),
-            monster_name=event_data.get('monster_name')
+        item_event = self._build_item_event(
+            'drop', event_data, monster_name=event_data.get('monster_name')
         )
         
         if self._should_log_item(item_event):
             self._add_item_event(item_event)
-            self.session_stats['drops_count'] += 1
+            self.session_stats.drops_count += 1
     
     def _handle_item_picked_up(self, event_data: Dict[str, Any]) -> None:
         """Processa pickup de item."""
-        if not self.config.get('log_pickups', True):
+        if not self._log_pickups:
             return
         
-        item_event = ItemEvent(
-            timestamp=time.time(),
-            event_type='pickup',
-            item_name=event_data.get('item_name', ''),
-            item_id=event_data.get('item_id', 0),
-            quantity=event_data.get('quantity', 1),
-            map_name=event_data.get('map_name', ''),
-            coordinates=event_data.get('coordinates', (0, 0))
-        )
+        item_event = self._build_item_event('pickup', event_data)
         
         if self._should_log_item(item_event):
             self._add_item_event(item_event)
-            self.session_stats['pickups_count'] += 1
-            self.session_stats['unique_items'].add(item_event.item_name)
+            self.session_stats.pickups_count += 1
+            self.session_stats.unique_items.add(item_event.item_name)
     
     def _handle_item_sold(self, event_data: Dict[str, Any]) -> None:
         """Processa venda de item."""
-        if not self.config.get('log_sales', True):
+        if not self._log_sales:
             return
         
-        item_event = ItemEvent(
-            timestamp=time.time(),
-            event_type='sold',
-            item_name=event_data.get('item_name', ''),
-            item_id=event_data.get('item_id', 0),
-            quantity=event_data.get('quantity', 1),
-            map_name=event_data.get('map_name', ''),
-            coordinates=event_data.get('coordinates', (0, 0)),
+        item_event = self._build_item_event(
+            'sold', event_data,
             npc_name=event_data.get('npc_name'),
             price=event_data.get('price', 0)
         )
         
         if self._should_log_item(item_event):
             self._add_item_event(item_event)
-            self.session_stats['sales_count'] += 1
-            self.session_stats['total_zeny_gained'] += item_event.price or 0
+            self.session_stats.sales_count += 1
+            self.session_stats.total_zeny_gained += item_event.price or 0
     
     def _handle_item_bought(self, event_data: Dict[str, Any]) -> None:
         """Processa compra de item."""
-        if not self.config.get('log_purchases', True):
+        if not self._log_purchases:
             return
         
-        item_event = ItemEvent(
-            timestamp=time.time(),
-            event_type='bought',
-            item_name=event_data.get('item_name', ''),
-            item_id=event_data.get('item_id', 0),
-            quantity=event_data.get('quantity', 1),
-            map_name=event_data.get('map_name', ''),
-            coordinates=event_data.get('coordinates', (0, 0)),
+        item_event = self._build_item_event(
+            'bought', event_data,
             npc_name=event_data.get('npc_name'),
             price=event_data.get('price', 0)
         )
         
         if self._should_log_item(item_event):
             self._add_item_event(item_event)
-            self.session_stats['purchases_count'] += 1
-            self.session_stats['total_zeny_spent'] += item_event.price or 0
+            self.session_stats.purchases_count += 1
+            self.session_stats.total_zeny_spent += item_event.price or 0
     
     def _handle_item_traded(self, event_data: Dict[str, Any]) -> None:
         """Processa trade de item."""
-        if not self.config.get('log_trades', True):
+        if not self._log_trades:
             return
         
-        item_event = ItemEvent(
-            timestamp=time.time(),
-            event_type='traded',
-            item_name=event_data.get('item_name', ''),
-            item_id=event_data.get('item_id', 0),
-            quantity=event_data.get('quantity', 1),
-            map_name=event_data.get('map_name', ''),
-            coordinates=event_data.get('coordinates', (0, 0)),
-            player_name=event_data.get('player_name')
+        item_event = self._build_item_event(
+            'traded', event_data, player_name=event_data.get('player_name')
         )
         
         if self._should_log_item(item_event):
             self._add_item_event(item_event)
-            self.session_stats['trades_count'] += 1
+            self.session_stats.trades_count += 1
     
     def _handle_monster_killed(self, event_data: Dict[str, Any]) -> None:
         """Processa morte de monstro."""
         monster_name = event_data.get('monster_name', '')
         if monster_name:
-            if monster_name not in self.session_stats['monsters_killed']:
-                self.session_stats['monsters_killed'][monster_name] = 0
-            self.session_stats['monsters_killed'][monster_name] += 1
+            self.session_stats.monsters_killed[monster_name] += 1
+            self._log_dirty = True
     
     def _handle_map_changed(self, event_data: Dict[str, Any]) -> None:
         """Processa mudança de mapa."""
         map_name = event_data.get('map_name', '')
         if map_name:
-            self.session_stats['maps_visited'].add(map_name)
+            self.session_stats.maps_visited.add(map_name)
+            self._log_dirty = True
     
     def _handle_timer_tick(self, event_data: Dict[str, Any]) -> None:
         """Processa tick do timer."""
         current_time = time.time()
-        auto_save_interval = self.config.get('auto_save_interval', 300)
         
-        if current_time - self.last_save >= auto_save_interval:
-            self._save_log_file()
+        if current_time - self.last_save >= self._auto_save_interval:
+            if self._log_dirty:
+                self._save_log_file()
             self.last_save = current_time
     
     def _should_log_item(self, item_event: ItemEvent) -> bool:
@@ -270,21 +654,20 @@ class ItemLoggerPlugin(BasePlugin):
         Returns:
             True se deve ser logado
         """
+        item_name = item_event.item_name.lower()
+        
         # Verifica blacklist
-        blacklist = self.config.get('blacklist_items', [])
-        if item_event.item_name.lower() in [item.lower() for item in blacklist]:
+        if item_name in self._blacklist_lc:
             return False
         
         # Verifica whitelist (se definida)
-        whitelist = self.config.get('whitelist_items', [])
-        if whitelist and item_event.item_name.lower() not in [item.lower() for item in whitelist]:
+        if self._whitelist_lc and item_name not in self._whitelist_lc:
             return False
         
         # Verifica valor mínimo
-        if self.config.get('filter_worthless', False):
-            min_value = self.config.get('min_item_value', 0)
+        if self._filter_worthless:
             item_value = self._get_item_value(item_event.item_id)
-            if item_value < min_value:
+            if item_value < self._min_item_value:
                 return False
         
         return True
@@ -309,130 +692,282 @@ class ItemLoggerPlugin(BasePlugin):
         Args:
             item_event: Evento a adicionar
         """
-        self.item_events.append(item_event)
+        # Limita tamanho do log (o ring buffer descarta os mais antigos)
+        if self._max_log_size != self._events.capacity:
+            self._events.resize(self._max_log_size)
         
-        # Limita tamanho do log
-        max_size = self.config.get('max_log_size', 10000)
-        if len(self.item_events) > max_size:
-            # Remove eventos mais antigos
-            self.item_events = self.item_events[-max_size:]
+        self._events.append(item_event)
+        self._indexes_dirty = True
+        self._log_dirty = True
         
         self.logger.debug(f"Item event: {item_event.event_type} - {item_event.item_name} x{item_event.quantity}")
     
+    @property
+    def _events(self) -> ItemEventColumns:
+        """Eventos de item; carrega o log pendente no primeiro acesso."""
+        if self._pending_log is not None:
+            self._load_pending_events()
+        return self._event_store
+    
     def _load_log_file(self) -> None:
-        """Carrega arquivo de log."""
+        """
+        Carrega arquivo de log.
+        
+        O arquivo é mapeado em memória e só o cabeçalho é lido agora; os
+        eventos (um por linha) são desserializados no primeiro acesso.
+        Logs no formato antigo são carregados por completo.
+        """
         log_file = Path(self.config.get('log_file', 'item_log.json'))
         
         try:
-            if log_file.exists():
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            if log_file.exists() and log_file.stat().st_size:
+                with open(log_file, 'rb') as f:
+                    log_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                
+                header_end = log_map.find(_EVENTS_HEADER)
+                if header_end >= 0:
+                    header = _load_json(log_map[:header_end] + b'\n}')
+                    self._pending_log = (log_map, header_end + len(_EVENTS_HEADER))
+                    total = header.get('metadata', {}).get('total_events', 0)
+                    self.logger.info(f"Log de itens mapeado: {total} eventos (carregados sob demanda)")
+                    return
+                
+                # Formato antigo: JSON completo
+                try:
+                    data = _load_json(log_map[:])
+                finally:
+                    log_map.close()
                 
-                # Carrega eventos
                 for event_data in data.get('events', []):
-                    item_event = ItemEvent(**event_data)
-                    self.item_events.append(item_event)
+                    self._event_store.append(ItemEvent.from_dict(event_data))
+                self._indexes_dirty = True
                 
-                self.logger.info(f"Carregados {len(self.item_events)} eventos do log")
+                self.logger.info(f"Carregados {len(self._event_store)} eventos do log")
+            
+        except Exception as e:
+            self.logger.error(f"Erro ao carregar log de itens: {e}")
+    
+    def _load_pending_events(self) -> None:
+        """Desserializa os eventos do log mapeado por _load_log_file."""
+        log_map, offset = self._pending_log
+        self._pending_log = None
+        
+        try:
+            log_map.seek(offset)
+            for line in iter(log_map.readline, b''):
+                line = line.strip().rstrip(b',')
+                if line.startswith(b'{'):
+                    self._event_store.append(ItemEvent.from_dict(_load_json(line)))
+            self._indexes_dirty = True
+            
+            self.logger.info(f"Carregados {len(self._event_store)} eventos do log")
             
         except Exception as e:
             self.logger.error(f"Erro ao carregar log de itens: {e}")
+        finally:
+            log_map.close()
+    
+    def _close_pending_log(self) -> None:
+        """Descarta o log mapeado ainda não carregado."""
+        if self._pending_log is not None:
+            self._pending_log[0].close()
+            self._pending_log = None
     
     def _save_log_file(self) -> None:
-        """Salva arquivo de log."""
+        """
+        Salva arquivo de log.
+        
+        Monta um snapshot dos dados e o entrega à thread de gravação,
+        para não bloquear o handler com serialização e disco.
+        """
         log_file = Path(self.config.get('log_file', 'item_log.json'))
         
         try:
-            # Prepara dados
+            # Prepara snapshot (sem estruturas compartilhadas com a sessão)
             data = {
                 'metadata': {
                     'version': '1.0',
-                    'created': datetime.now().isoformat(),
-                    'session_start': datetime.fromtimestamp(self.session_start).isoformat(),
-                    'total_events': len(self.item_events)
-                },
-                'session_stats': {
-                    **self.session_stats,
-                    'unique_items': list(self.session_stats['unique_items']),
-                    'maps_visited': list(self.session_stats['maps_visited'])
+                    'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                    'session_start': self._session_start_iso,
+                    'epoch_ns': _EPOCH_NS,
+                    'total_events': len(self._events)
                 },
-                'events': [event.to_dict() for event in self.item_events]
+                'session_stats': self.session_stats.to_dict(),
+                # Cópia das colunas; os eventos são montados na thread de gravação
+                'events': self._events.snapshot()
             }
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar log de itens: {e}")
+            return
+        
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="ItemLoggerWriter", daemon=True
+            )
+            self._writer_thread.start()
+        
+        self._save_queue.put((log_file, data))
+        self._log_dirty = False
+    
+    def _flush_saves(self) -> None:
+        """Aguarda a conclusão das gravações pendentes."""
+        if self._writer_thread is not None:
+            self._save_queue.join()
+    
+    def _writer_loop(self) -> None:
+        """Loop da thread de gravação; None na fila encerra a thread."""
+        while True:
+            job = self._save_queue.get()
+            try:
+                if job is None:
+                    return
+                
+                # Só o snapshot mais recente importa
+                while True:
+                    try:
+                        newer = self._save_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    self._save_queue.task_done()
+                    if newer is None:
+                        self._write_log_file(*job)
+                        return
+                    job = newer
+                
+                self._write_log_file(*job)
+            finally:
+                self._save_queue.task_done()
+    
+    def _write_log_file(self, log_file: Path, data: Dict[str, Any]) -> None:
+        """
+        Grava snapshot no disco de forma atômica.
+        
+        Args:
+            log_file: Caminho do arquivo de log
+            data: Snapshot a gravar
+        
+        Os eventos são escritos um por linha, sem montar a lista inteira
+        de dicionários nem o JSON completo em memória.
+        """
+        try:
+            # Escreve em arquivo temporário e substitui o original
+            temp_file = log_file.with_name(log_file.name + '.tmp')
+            with open(temp_file, 'wb') as f:
+                f.write(b'{\n"metadata": ' + _dump_json(data['metadata']))
+                f.write(b',\n"session_stats": ' + _dump_json(data['session_stats']))
+                f.write(_EVENTS_HEADER)
+                separator = b'\n'
+                events = data['events']
+                for slot in events.slots():
+                    f.write(separator)
+                    f.write(_dump_json(events.get(slot).to_dict(), indent=False))
+                    separator = b',\n'
+                f.write(b'\n]\n}\n')
+            os.replace(temp_file, log_file)
             
-            # Salva arquivo
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            self.logger.debug(f"Log salvo: {len(self.item_events)} eventos")
+            self.logger.debug(f"Log salvo: {data['metadata']['total_events']} eventos")
             
         except Exception as e:
+            # Mantém pendente para a próxima tentativa do autosave
+            self._log_dirty = True
             self.logger.error(f"Erro ao salvar log de itens: {e}")
     
     # Métodos de consulta e análise
+    @property
+    def item_events(self) -> List[ItemEvent]:
+        """Todos os eventos, do mais antigo para o mais recente."""
+        return self._events.select(self._events.slots())
+    
+    def _rebuild_indexes(self) -> None:
+        """
+        Reconstrói os índices invertidos em uma única passada.
+        
+        Nomes de item, monstro e mapa são indexados em minúsculas.
+        """
+        events = self._events
+        by_type: Dict[str, List[int]] = {}
+        by_item: Dict[str, List[int]] = {}
+        by_monster: Dict[str, List[int]] = {}
+        by_map: Dict[str, List[int]] = {}
+        
+        type_names = events.type_names
+        rows = zip(
+            events.slots(),
+            events.ordered(events.type_codes),
+            events.ordered(events.item_names),
+            events.ordered(events.monster_names),
+            events.ordered(events.map_names)
+        )
+        for slot, type_code, item_name, monster_name, map_name in rows:
+            by_type.setdefault(type_names[type_code], []).append(slot)
+            by_item.setdefault(item_name.lower(), []).append(slot)
+            if monster_name:
+                by_monster.setdefault(monster_name.lower(), []).append(slot)
+            by_map.setdefault(map_name.lower(), []).append(slot)
+        
+        self._idx_by_type = by_type
+        self._idx_by_item = by_item
+        self._idx_by_monster = by_monster
+        self._idx_by_map = by_map
+        self._indexes_dirty = False
+    
+    def _lookup(self, index_name: str, key: str) -> List[ItemEvent]:
+        """
+        Materializa eventos de um índice invertido.
+        
+        Args:
+            index_name: Nome do atributo do índice
+            key: Chave procurada
+        """
+        if self._indexes_dirty:
+            self._rebuild_indexes()
+        return self._events.select(getattr(self, index_name).get(key, ()))
+    
     def get_events_by_type(self, event_type: str) -> List[ItemEvent]:
         """Obtém eventos por tipo."""
-        return [event for event in self.item_events if event.event_type == event_type]
+        return self._lookup('_idx_by_type', event_type)
     
     def get_events_by_item(self, item_name: str) -> List[ItemEvent]:
         """Obtém eventos por item."""
-        return [event for event in self.item_events 
-                if event.item_name.lower() == item_name.lower()]
+        return self._lookup('_idx_by_item', item_name.lower())
     
     def get_events_by_monster(self, monster_name: str) -> List[ItemEvent]:
         """Obtém eventos por monstro."""
-        return [event for event in self.item_events 
-                if event.monster_name and event.monster_name.lower() == monster_name.lower()]
+        return self._lookup('_idx_by_monster', monster_name.lower())
     
     def get_events_by_map(self, map_name: str) -> List[ItemEvent]:
         """Obtém eventos por mapa."""
-        return [event for event in self.item_events 
-                if event.map_name.lower() == map_name.lower()]
+        return self._lookup('_idx_by_map', map_name.lower())
     
     def get_events_in_timerange(self, start_time: float, end_time: float) -> List[ItemEvent]:
-        """Obtém eventos em período."""
-        return [event for event in self.item_events 
-                if start_time <= event.timestamp <= end_time]
+        """Obtém eventos em período (start_time/end_time como time.time())."""
+        start_ns = int(start_time * 1e9) - _EPOCH_NS
+        end_ns = int(end_time * 1e9) - _EPOCH_NS
+        return self._events.select(self._events.slots_in_timerange(start_ns, end_ns))
     
     def get_item_statistics(self) -> Dict[str, Any]:
         """Obtém estatísticas de itens."""
+        # Agregados já mantidos incrementalmente pelo armazenamento
+        events = self._events
+        type_names = events.type_names
+        item_quantities = events.item_quantities
         stats = {
-            'total_events': len(self.item_events),
-            'by_type': {},
-            'by_item': {},
-            'by_monster': {},
-            'by_map': {},
+            'total_events': len(events),
+            'by_type': {
+                type_names[code]: count for code, count in events.type_counts.items()
+            },
+            'by_item': {
+                item_name: {'count': count, 'quantity': item_quantities[item_name]}
+                for item_name, count in events.item_counts.items()
+            },
+            'by_monster': dict(events.monster_drops),
+            'by_map': dict(events.map_counts),
             'session': {
-                **self.session_stats,
-                'unique_items': list(self.session_stats['unique_items']),
-                'maps_visited': list(self.session_stats['maps_visited']),
+                **self.session_stats.to_dict(),
                 'duration_hours': (time.time() - self.session_start) / 3600
             }
         }
         
-        # Estatísticas por tipo
-        for event in self.item_events:
-            event_type = event.event_type
-            if event_type not in stats['by_type']:
-                stats['by_type'][event_type] = 0
-            stats['by_type'][event_type] += 1
-            
-            # Por item
-            if event.item_name not in stats['by_item']:
-                stats['by_item'][event.item_name] = {'count': 0, 'quantity': 0}
-            stats['by_item'][event.item_name]['count'] += 1
-            stats['by_item'][event.item_name]['quantity'] += event.quantity
-            
-            # Por monstro (apenas drops)
-            if event.monster_name and event.event_type == 'drop':
-                if event.monster_name not in stats['by_monster']:
-                    stats['by_monster'][event.monster_name] = 0
-                stats['by_monster'][event.monster_name] += 1
-            
-            # Por mapa
-            if event.map_name not in stats['by_map']:
-                stats['by_map'][event.map_name] = 0
-            stats['by_map'][event.map_name] += 1
-        
         return stats
     
     def export_csv(self, filename: str) -> bool:
@@ -449,14 +984,15 @@ class ItemLoggerPlugin(BasePlugin):
             import csv
             
             with open(filename, 'w', newline='', encoding='utf-8') as f:
-                if not self.item_events:
+                if not len(self._events):
                     return True
                 
-                writer = csv.DictWriter(f, fieldnames=self.item_events[0].to_dict().keys())
-                writer.writeheader()
+                writer = csv.writer(f)
+                writer.writerow(ItemEvent._fields)
                 
-                for event in self.item_events:
-                    writer.writerow(event.to_dict())
+                events = self._events
+                for slot in events.slots():
+                    writer.writerow(events.get(slot).as_row())
             
             self.logger.info(f"Dados exportados para {filename}")
             return True
@@ -467,20 +1003,13 @@ class ItemLoggerPlugin(BasePlugin):
     
     def clear_log(self) -> None:
         """Limpa log de eventos."""
-        self.item_events.clear()
-        self.session_stats = {
-            'drops_count': 0,
-            'pickups_count': 0,
-            'sales_count': 0,
-            'purchases_count': 0,
-            'trades_count': 0,
-            'total_zeny_gained': 0,
-            'total_zeny_spent': 0,
-            'unique_items': set(),
-            'monsters_killed': {},
-            'maps_visited': set()
-        }
+        self._close_pending_log()
+        self._event_store.clear()
+        self._indexes_dirty = True
+        self._log_dirty = True
+        self.session_stats = SessionStats()
         self.session_start = time.time()
+        self._session_start_iso = datetime.fromtimestamp(self.session_start).isoformat()
         self.logger.info("Log de itens limpo")
     
     def get_summary_report(self) -> str:
@@ -517,8 +1046,8 @@ class ItemLoggerPlugin(BasePlugin):
 """
         
         # Top 5 itens mais coletados
-        top_items = sorted(stats['by_item'].items(), 
-                          key=lambda x: x[1]['quantity'], reverse=True)[:5]
+        top_items = heapq.nlargest(5, stats['by_item'].items(),
+                                   key=lambda x: x[1]['quantity'])
         
         for i, (item_name, data) in enumerate(top_items, 1):
             report += f"   {i}. {item_name}: {data['quantity']} unidades\n"
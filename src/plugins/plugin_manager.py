@@ -9,15 +9,36 @@ import os
 import sys
 import importlib
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Type, Set
-from collections import defaultdict
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Any, Type, Set, Tuple
+from collections import defaultdict, deque
 
 from base_plugin import BasePlugin, PluginStatus, PluginType
 from core.logging.logger import Logger
 from core.events.event_bus import EventBus
 
 
+# Conjunto vazio compartilhado para leituras em mapas de dependências
+_EMPTY: FrozenSet[str] = frozenset()
+
+# Critérios de find_plugins verificados plugin a plugin (tipo e autor usam índices)
+_CRITERIA_CHECKS: Dict[str, Callable[[BasePlugin, Any], bool]] = {
+    'status': lambda plugin, value: plugin.status == value,
+}
+
+# Estados da busca em profundidade sobre dependências
+_VISITING = 1
+_DONE = 2
+
+# Módulos de plugin registrados em sys.modules: nome -> mtime_ns do arquivo
+_plugin_module_mtimes: Dict[str, int] = {}
+
+# Prefixo das chaves em sys.modules: um plugin nunca ocupa o nome de outro
+# módulo (ex.: plugin csv.py não substitui o csv da stdlib)
+_PLUGIN_MODULE_PREFIX = 'pythonkore_plugins.'
+
+
 class PluginManager:
     """
     Gerenciador de plugins.
@@ -51,15 +72,23 @@ class PluginManager:
         # Plugins registrados
         self.plugins: Dict[str, BasePlugin] = {}
         self.plugin_classes: Dict[str, Type[BasePlugin]] = {}
+        # Classes já importadas: arquivo -> (mtime_ns, classe ou None se inválido)
+        self._class_cache: Dict[Path, Tuple[int, Optional[Type[BasePlugin]]]] = {}
         
         # Metadados
-        self.plugin_dependencies: Dict[str, Set[str]] = defaultdict(set)
-        self.plugin_dependents: Dict[str, Set[str]] = defaultdict(set)
+        self.plugin_dependencies: Dict[str, Set[str]] = {}
+        self.plugin_dependents: Dict[str, Set[str]] = {}
+        
+        # Índices para consultas (tipo/autor -> nomes)
+        self._by_type: Dict[PluginType, Set[str]] = {}
+        self._by_author: Dict[str, Set[str]] = {}
         
         # Estado
         self.is_initialized = False
         self.auto_load_enabled = True
         self.load_order: List[str] = []
+        self._active_set: Set[str] = set()  # Plugins ativados pelo gerenciador
+        self._load_order_dirty = True  # Recalcular load_order (plugins mudaram)
         
         # Estatísticas
         self.stats = {
@@ -104,23 +133,83 @@ class PluginManager:
         """
         Descobre plugins nos diretórios configurados.
         
+        Os módulos são importados em paralelo (leitura de disco e
+        exec_module); o registro das classes é feito na thread atual,
+        na ordem dos arquivos. Carga/ativação continuam sequenciais.
+        Arquivos não modificados desde a última importação (mesmo mtime)
+        reutilizam a classe em cache, sem novo exec_module; arquivos que
+        falharam (erro ou sem classe de plugin) só são reimportados
+        quando modificados.
+        
+        Cada diretório é percorrido uma única vez; se o mesmo nome de
+        plugin aparece em mais de um, vale o do último diretório.
+        
         Returns:
             Lista de nomes de plugins descobertos
         """
         discovered = []
+        candidates: Dict[str, Tuple[Path, Optional[int]]] = {}
+        walked: Set[str] = set()
         
         for plugin_dir in self.plugin_dirs:
+            real_dir = os.path.realpath(plugin_dir)
+            if real_dir in walked:
+                continue  # Diretório repetido
+            walked.add(real_dir)
+            
             self.logger.debug(f"Descobrindo plugins em: {plugin_dir}")
             
-            # Procura arquivos .py
-            for plugin_file in plugin_dir.glob("*.py"):
-                if plugin_file.name.startswith("_"):
-                    continue  # Ignora arquivos privados
+            # Procura arquivos .py (scandir: sem Path/stat extras por entrada)
+            try:
+                entries = list(os.scandir(plugin_dir))
+            except OSError as e:
+                self.logger.error(f"Erro ao listar diretório de plugins {plugin_dir}: {e}")
+                continue
+            
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".py") or name.startswith((".", "_")):
+                    continue  # Ignora arquivos privados/ocultos
                 
-                plugin_name = plugin_file.stem
+                try:
+                    if not entry.is_file():
+                        continue
+                    mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    mtime_ns = None
                 
+                plugin_name = name[:-3]
+                if plugin_name in candidates:
+                    self.logger.debug(f"Plugin {plugin_name} em {plugin_dir} sobrepõe {candidates[plugin_name][0]}")
+                candidates[plugin_name] = (Path(entry.path), mtime_ns)
+        
+        if candidates:
+            class_cache = self._class_cache
+            misses = []
+            for plugin_name, (plugin_file, mtime_ns) in candidates.items():
+                entry = class_cache.get(plugin_file)
+                if entry is None or entry[0] != mtime_ns:
+                    misses.append((plugin_file, plugin_name))
+            
+            futures = {}
+            if misses:
+                with ThreadPoolExecutor(max_workers=min(32, len(misses)),
+                                        thread_name_prefix="PluginDiscovery") as executor:
+                    for plugin_file, plugin_name in misses:
+                        futures[plugin_file] = executor.submit(
+                            self._load_plugin_class, plugin_file, plugin_name
+                        )
+            
+            for plugin_name, (plugin_file, mtime_ns) in candidates.items():
                 try:
-                    plugin_class = self._load_plugin_class(plugin_file, plugin_name)
+                    future = futures.get(plugin_file)
+                    if future is None:
+                        plugin_class = class_cache[plugin_file][1]
+                    else:
+                        plugin_class = future.result()
+                        if mtime_ns is not None:
+                            class_cache[plugin_file] = (mtime_ns, plugin_class)
+                    
                     if plugin_class:
                         self.plugin_classes[plugin_name] = plugin_class
                         discovered.append(plugin_name)
@@ -146,21 +235,35 @@ class PluginManager:
             Classe do plugin ou None
         """
         try:
-            # Carrega módulo
-            spec = importlib.util.spec_from_file_location(plugin_name, plugin_file)
-            if not spec or not spec.loader:
-                return None
+            # Reaproveita o módulo já importado do mesmo arquivo, se não mudou
+            plugin_path = str(plugin_file)
+            mtime_ns = os.stat(plugin_path).st_mtime_ns
+            module_key = _PLUGIN_MODULE_PREFIX + plugin_name
+            module = sys.modules.get(module_key)
             
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Procura classe que herda de BasePlugin
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
+            if (module is None or
+                getattr(module, '__file__', None) != plugin_path or
+                _plugin_module_mtimes.get(plugin_name) != mtime_ns):
+                # Carrega módulo
+                spec = importlib.util.spec_from_file_location(module_key, plugin_file)
+                if not spec or not spec.loader:
+                    return None
+                
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
                 
-                if (isinstance(attr, type) and 
-                    issubclass(attr, BasePlugin) and 
-                    attr != BasePlugin):
+                # Registra só depois de executado: as threads de importação
+                # paralela nunca veem um módulo pela metade
+                sys.modules[module_key] = module
+                _plugin_module_mtimes[plugin_name] = mtime_ns
+            
+            # Procura classe que herda de BasePlugin, definida no próprio módulo
+            module_name = module.__name__
+            for attr in vars(module).values():
+                if (isinstance(attr, type) and
+                    attr.__module__ == module_name and
+                    issubclass(attr, BasePlugin) and
+                    attr is not BasePlugin):
                     return attr
             
             self.logger.warning(f"Nenhuma classe BasePlugin encontrada em {plugin_file}")
@@ -204,11 +307,14 @@ class PluginManager:
                 # Registra dependências
                 if plugin.info:
                     self.plugin_dependencies[plugin_name] = set(plugin.info.dependencies)
+                    self._by_type.setdefault(plugin.info.plugin_type, set()).add(plugin_name)
+                    self._by_author.setdefault(plugin.info.author, set()).add(plugin_name)
                     
                     # Atualiza dependents
                     for dep in plugin.info.dependencies:
-                        self.plugin_dependents[dep].add(plugin_name)
+                        self.plugin_dependents.setdefault(dep, set()).add(plugin_name)
                 
+                self._load_order_dirty = True
                 self.logger.info(f"Plugin carregado: {plugin_name}")
                 return True
             else:
@@ -239,8 +345,8 @@ class PluginManager:
         
         try:
             # Verifica dependents
-            dependents = self.plugin_dependents.get(plugin_name, set())
-            active_dependents = [dep for dep in dependents if self.is_plugin_active(dep)]
+            dependents = self.plugin_dependents.get(plugin_name, _EMPTY)
+            active_dependents = list(dependents & self._active_set)
             
             if active_dependents:
                 self.logger.warning(f"Plugin {plugin_name} tem dependents ativos: {active_dependents}")
@@ -253,14 +359,19 @@ class PluginManager:
                 del self.plugins[plugin_name]
                 self.stats['total_loaded'] -= 1
                 
-                # Remove dependências
-                if plugin_name in self.plugin_dependencies:
-                    del self.plugin_dependencies[plugin_name]
+                # Remove dependências e o plugin dos dependents delas
+                for dep in self.plugin_dependencies.pop(plugin_name, _EMPTY):
+                    self._discard_from_index(self.plugin_dependents, dep, plugin_name)
                 
-                # Remove de dependents
-                for deps in self.plugin_dependents.values():
-                    deps.discard(plugin_name)
+                # Remove dos índices de consulta
+                if plugin.info:
+                    self._discard_from_index(self._by_type, plugin.info.plugin_type, plugin_name)
+                    self._discard_from_index(self._by_author, plugin.info.author, plugin_name)
                 
+                # unload() desativa o plugin, se necessário
+                self._active_set.discard(plugin_name)
+                self.stats['total_active'] = len(self._active_set)
+                self._load_order_dirty = True
                 self.logger.info(f"Plugin descarregado: {plugin_name}")
                 return True
             else:
@@ -271,6 +382,15 @@ class PluginManager:
             self.logger.error(f"Erro ao descarregar plugin {plugin_name}: {e}")
             return False
     
+    @staticmethod
+    def _discard_from_index(index: Dict[Any, Set[str]], key: Any, plugin_name: str) -> None:
+        """Remove plugin de um índice, apagando a chave se ficar vazia."""
+        names = index.get(key)
+        if names is not None:
+            names.discard(plugin_name)
+            if not names:
+                del index[key]
+    
     def activate_plugin(self, plugin_name: str) -> bool:
         """
         Ativa um plugin.
@@ -286,20 +406,56 @@ class PluginManager:
             if not self.load_plugin(plugin_name):
                 return False
         
-        plugin = self.plugins[plugin_name]
+        # Ativa dependências antes (DFS iterativa com pilha explícita;
+        # cada dependência é carregada antes de ler as suas próprias)
+        get_dependencies = self.plugin_dependencies.get
+        color: Dict[str, int] = {plugin_name: _VISITING}
+        stack = [(plugin_name, iter(get_dependencies(plugin_name, _EMPTY)))]
         
-        # Verifica dependências
-        dependencies = self.plugin_dependencies.get(plugin_name, set())
-        for dep in dependencies:
-            if not self.is_plugin_active(dep):
-                self.logger.info(f"Ativando dependência {dep} para {plugin_name}")
-                if not self.activate_plugin(dep):
+        while stack:
+            name, dependencies = stack[-1]
+            
+            for dep in dependencies:
+                state = color.get(dep)
+                if state == _VISITING:
+                    self.logger.warning(f"Dependência circular detectada envolvendo {dep}")
+                    continue
+                if state == _DONE or dep in self._active_set:
+                    continue
+                
+                self.logger.info(f"Ativando dependência {dep} para {name}")
+                if dep not in self.plugins and not self.load_plugin(dep):
                     self.logger.error(f"Falha ao ativar dependência {dep}")
                     return False
+                
+                color[dep] = _VISITING
+                stack.append((dep, iter(get_dependencies(dep, _EMPTY))))
+                break
+            else:
+                # Todas as dependências de name foram tratadas
+                stack.pop()
+                color[name] = _DONE
+                if name != plugin_name and not self._activate_loaded_plugin(name):
+                    self.logger.error(f"Falha ao ativar dependência {name}")
+                    return False
+        
+        return self._activate_loaded_plugin(plugin_name)
+    
+    def _activate_loaded_plugin(self, plugin_name: str) -> bool:
+        """
+        Ativa plugin já carregado, sem tratar dependências.
+        
+        Args:
+            plugin_name: Nome do plugin
+            
+        Returns:
+            True se ativado com sucesso
+        """
+        plugin = self.plugins[plugin_name]
         
-        # Ativa plugin
         if plugin.activate():
-            self.stats['total_active'] += 1
+            self._active_set.add(plugin_name)
+            self.stats['total_active'] = len(self._active_set)
             self.logger.info(f"Plugin ativado: {plugin_name}")
             return True
         else:
@@ -323,7 +479,8 @@ class PluginManager:
         
         if plugin.deactivate():
             if plugin.status == PluginStatus.INACTIVE:
-                self.stats['total_active'] -= 1
+                self._active_set.discard(plugin_name)
+                self.stats['total_active'] = len(self._active_set)
             self.logger.info(f"Plugin desativado: {plugin_name}")
             return True
         else:
@@ -346,6 +503,15 @@ class PluginManager:
         if not self.unload_plugin(plugin_name):
             return False
         
+        # Força nova importação do módulo do plugin
+        plugin_class = self.plugin_classes.get(plugin_name)
+        if plugin_class is not None:
+            for plugin_file, (_, cached_class) in list(self._class_cache.items()):
+                if cached_class is plugin_class:
+                    del self._class_cache[plugin_file]
+        if _plugin_module_mtimes.pop(plugin_name, None) is not None:
+            sys.modules.pop(_PLUGIN_MODULE_PREFIX + plugin_name, None)
+        
         # Redescobre
         self.discover_plugins()
         
@@ -374,26 +540,26 @@ class PluginManager:
         
         # Carrega em ordem de dependências
         loaded_count = 0
-        remaining = set(discovered)
+        order, cyclic = self._topological_order(discovered)
+        unresolved = []
         
-        while remaining:
-            progress_made = False
-            
-            for plugin_name in list(remaining):
-                # Verifica se dependências estão carregadas
-                dependencies = self.plugin_dependencies.get(plugin_name, set())
-                
-                if dependencies.issubset(self.plugins.keys()):
-                    if self.load_plugin(plugin_name):
-                        loaded_count += 1
-                        remaining.remove(plugin_name)
-                        progress_made = True
+        get_dependencies = self.plugin_dependencies.get
+        loaded = self.plugins
+        load = self.load_plugin
+        
+        for plugin_name in order:
+            # Dependências já processadas (ordem topológica): basta checar se carregaram
+            dependencies = get_dependencies(plugin_name, _EMPTY)
             
-            # Se não houve progresso, há dependências circulares ou não resolvidas
-            if not progress_made:
-                for plugin_name in remaining:
-                    self.logger.error(f"Não foi possível carregar plugin {plugin_name} - dependências não resolvidas")
-                break
+            if all(dep in loaded for dep in dependencies):
+                if load(plugin_name):
+                    loaded_count += 1
+            else:
+                unresolved.append(plugin_name)
+        
+        # Dependências circulares, ausentes ou que falharam ao carregar
+        for plugin_name in unresolved + cyclic:
+            self.logger.error(f"Não foi possível carregar plugin {plugin_name} - dependências não resolvidas")
         
         self.stats['load_time'] = time.time() - start_time
         self.logger.info(f"Carregados {loaded_count}/{len(discovered)} plugins em {self.stats['load_time']:.2f}s")
@@ -417,43 +583,66 @@ class PluginManager:
         self.logger.info(f"Ativados {activated_count} plugins")
         return activated_count
     
+    def _topological_order(self, plugin_names: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """
+        Ordena plugins por dependências (algoritmo de Kahn, O(V+E)).
+        
+        Só dependências dentro do próprio conjunto são consideradas.
+        
+        Args:
+            plugin_names: Plugins a ordenar
+            
+        Returns:
+            Tupla (ordem, plugins em dependências circulares)
+        """
+        names = list(dict.fromkeys(plugin_names))
+        name_set = set(names)
+        
+        pending: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        get_dependencies = self.plugin_dependencies.get
+        for plugin_name in names:
+            dependencies = [dep for dep in get_dependencies(plugin_name, _EMPTY)
+                            if dep in name_set]
+            pending[plugin_name] = len(dependencies)
+            for dep in dependencies:
+                dependents[dep].append(plugin_name)
+        
+        ready = deque(plugin_name for plugin_name in names if not pending[plugin_name])
+        order = []
+        while ready:
+            plugin_name = ready.popleft()
+            order.append(plugin_name)
+            for dependent in dependents.get(plugin_name, ()):
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    ready.append(dependent)
+        
+        cyclic = [plugin_name for plugin_name in names if pending[plugin_name]]
+        return order, cyclic
+    
     def _get_load_order(self) -> List[str]:
         """
         Obtém ordem de carregamento baseada em dependências.
         
+        A ordem fica em cache (load_order) até um plugin ser carregado
+        ou descarregado.
+        
         Returns:
             Lista ordenada de nomes de plugins
         """
-        order = []
-        visited = set()
-        temp_visited = set()
-        
-        def visit(plugin_name: str):
-            if plugin_name in temp_visited:
-                # Dependência circular detectada
-                self.logger.warning(f"Dependência circular detectada envolvendo {plugin_name}")
-                return
-            
-            if plugin_name in visited:
-                return
-            
-            temp_visited.add(plugin_name)
+        if self._load_order_dirty:
+            order, cyclic = self._topological_order(self.plugins.keys())
             
-            # Visita dependências primeiro
-            dependencies = self.plugin_dependencies.get(plugin_name, set())
-            for dep in dependencies:
-                if dep in self.plugins:
-                    visit(dep)
+            # Plugins em ciclos entram no final, como antes
+            for plugin_name in cyclic:
+                self.logger.warning(f"Dependência circular detectada envolvendo {plugin_name}")
+                order.append(plugin_name)
             
-            temp_visited.remove(plugin_name)
-            visited.add(plugin_name)
-            order.append(plugin_name)
-        
-        # Visita todos os plugins
-        for plugin_name in self.plugins.keys():
-            visit(plugin_name)
+            self.load_order = order
+            self._load_order_dirty = False
         
-        return order
+        return list(self.load_order)
     
     # Consultas e informações
     def get_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
@@ -466,8 +655,7 @@ class PluginManager:
     
     def is_plugin_active(self, plugin_name: str) -> bool:
         """Verifica se plugin está ativo."""
-        plugin = self.plugins.get(plugin_name)
-        return plugin is not None and plugin.is_active()
+        return plugin_name in self._active_set
     
     def get_loaded_plugins(self) -> List[str]:
         """Obtém lista de plugins carregados."""
@@ -475,15 +663,11 @@ class PluginManager:
     
     def get_active_plugins(self) -> List[str]:
         """Obtém lista de plugins ativos."""
-        return [name for name, plugin in self.plugins.items() if plugin.is_active()]
+        return list(self._active_set)
     
     def get_plugins_by_type(self, plugin_type: PluginType) -> List[str]:
         """Obtém plugins por tipo."""
-        result = []
-        for name, plugin in self.plugins.items():
-            if plugin.info and plugin.info.plugin_type == plugin_type:
-                result.append(name)
-        return result
+        return list(self._by_type.get(plugin_type, _EMPTY))
     
     def find_plugins(self, **criteria) -> List[str]:
         """
@@ -495,30 +679,29 @@ class PluginManager:
         Returns:
             Lista de nomes de plugins
         """
-        results = []
-        
-        for name, plugin in self.plugins.items():
-            match = True
-            
-            for key, value in criteria.items():
-                if key == 'status':
-                    if plugin.status != value:
-                        match = False
-                        break
-                elif key == 'type':
-                    if not plugin.info or plugin.info.plugin_type != value:
-                        match = False
-                        break
-                elif key == 'author':
-                    if not plugin.info or plugin.info.author != value:
-                        match = False
-                        break
-                # Adicione mais critérios conforme necessário
-            
-            if match:
-                results.append(name)
-        
-        return results
+        # Tipo e autor vêm dos índices, começando pelo menor conjunto
+        indexed = []
+        if 'type' in criteria:
+            indexed.append(self._by_type.get(criteria['type'], _EMPTY))
+        if 'author' in criteria:
+            indexed.append(self._by_author.get(criteria['author'], _EMPTY))
+        
+        if indexed:
+            indexed.sort(key=len)
+            names = indexed[0].intersection(*indexed[1:])
+        else:
+            names = self.plugins.keys()
+        
+        # Demais critérios: resolvidos uma vez em (verificação, valor)
+        # Adicione mais critérios em _CRITERIA_CHECKS conforme necessário
+        checks = [(_CRITERIA_CHECKS[key], value) for key, value in criteria.items()
+                  if key in _CRITERIA_CHECKS]
+        if not checks:
+            return list(names)
+        
+        plugins = self.plugins
+        return [name for name in names
+                if all(check(plugins[name], value) for check, value in checks)]
     
     # Hooks globais
     def add_global_hook(self, hook_name: str, handler: callable) -> None:
@@ -548,13 +731,18 @@ class PluginManager:
     
     # Status e estatísticas
     def get_status(self) -> Dict[str, Any]:
-        """Obtém status do gerenciador."""
+        """
+        Obtém status do gerenciador.
+        
+        Returns:
+            Dicionário com cópias do estado atual (serializável em JSON)
+        """
         return {
             'initialized': self.is_initialized,
             'plugin_dirs': [str(d) for d in self.plugin_dirs],
             'total_plugins': len(self.plugins),
-            'active_plugins': len(self.get_active_plugins()),
-            'stats': self.stats.copy()
+            'active_plugins': self.stats['total_active'],
+            'stats': dict(self.stats)
         }
     
     def get_summary(self) -> List[Dict[str, Any]]:
@@ -591,4 +779,4 @@ class PluginManager:
     
     def __str__(self) -> str:
         """Representação string."""
-        return f"PluginManager({len(self.plugins)} plugins, {len(self.get_active_plugins())} ativos)" 
\ No newline at end of file
+        return f"PluginManager({len(self.plugins)} plugins, {self.stats['total_active']} ativos)" 
\ No newline at end of file
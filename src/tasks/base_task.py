@@ -5,16 +5,36 @@ Base Task
 Classe base para todas as tarefas do PythonKore.
 """
 
+import sys
 import time
 import asyncio
+import itertools
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, Any, Optional, List, Callable
-from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Set, List, Callable
 
 from core.logging.logger import Logger
 
 
+# Relógios ligados uma vez, sem a busca no módulo time a cada chamada
+_time = time.time
+_perf_counter_ns = time.perf_counter_ns
+
+# Sequência para IDs de tarefas (única dentro do processo)
+_task_counter = itertools.count()
+
+# Logger padrão compartilhado pelas tarefas sem logger próprio (criado sob demanda)
+_default_logger: Optional[Logger] = None
+
+
+def _get_default_logger() -> Logger:
+    """Obtém o logger padrão das tarefas, criando-o no primeiro uso."""
+    global _default_logger
+    if _default_logger is None:
+        _default_logger = Logger(level="INFO")
+    return _default_logger
+
+
 class TaskStatus(Enum):
     """Status de execução de uma tarefa."""
     PENDING = "pending"          # Aguardando execução
@@ -38,15 +58,51 @@ class TaskPriority(Enum):
     IDLE = 1           # Ocioso (espera)
 
 
+# Um bit por status (chave: valor bruto); testes de grupo viram um AND
+_STATUS_BITS = {status.value: 1 << i for i, status in enumerate(TaskStatus)}
+
+
+def _status_mask(*statuses: TaskStatus) -> int:
+    """Máscara com os bits dos status informados."""
+    return sum(_STATUS_BITS[status.value] for status in statuses)
+
+
+_FINISHED_MASK = _status_mask(TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED,
+                              TaskStatus.TIMEOUT, TaskStatus.SKIPPED)
+_ACTIVE_MASK = _status_mask(TaskStatus.RUNNING, TaskStatus.PAUSED)
+_FAILURE_MASK = _status_mask(TaskStatus.FAILED, TaskStatus.TIMEOUT)
+
+# Membros usados nas transições de estado (evita o lookup no Enum a cada chamada)
+_PENDING = TaskStatus.PENDING
+_RUNNING = TaskStatus.RUNNING
+_PAUSED = TaskStatus.PAUSED
+_COMPLETED = TaskStatus.COMPLETED
+_CANCELLED = TaskStatus.CANCELLED
+
+# Ícones por status usados em get_summary
+_STATUS_ICONS = {
+    TaskStatus.PENDING: "⏳",
+    TaskStatus.RUNNING: "🏃",
+    TaskStatus.PAUSED: "⏸️",
+    TaskStatus.COMPLETED: "✅",
+    TaskStatus.FAILED: "❌",
+    TaskStatus.CANCELLED: "🚫",
+    TaskStatus.TIMEOUT: "⏰",
+    TaskStatus.SKIPPED: "⏭️"
+}
+
+
 class TaskResult:
     """
     Resultado da execução de uma tarefa.
     """
     
+    __slots__ = ('status', 'message', 'data', 'error', 'timestamp')
+    
     def __init__(self,
                  status: TaskStatus,
                  message: str = "",
-                 data: Dict[str, Any] = None,
+                 data: Optional[Dict[str, Any]] = None,
                  error: Optional[Exception] = None):
         """
         Inicializa resultado.
@@ -59,36 +115,62 @@ class TaskResult:
         """
         self.status = status
         self.message = message
-        self.data = data or {}
+        self.data = {} if data is None else data
         self.error = error
-        self.timestamp = time.time()
+        self.timestamp = _time()
     
     def is_success(self) -> bool:
         """Verifica se foi sucesso."""
-        return self.status == TaskStatus.COMPLETED
+        return self.status is _COMPLETED
     
     def is_failure(self) -> bool:
         """Verifica se falhou."""
-        return self.status in [TaskStatus.FAILED, TaskStatus.TIMEOUT]
+        return (_STATUS_BITS[self.status.value] & _FAILURE_MASK) != 0
     
     def __str__(self) -> str:
         """Representação string."""
         return f"TaskResult({self.status.value}: {self.message})"
 
 
-@dataclass
 class TaskContext:
     """
     Contexto de execução de uma tarefa.
     
     Contém dados e referências necessárias para execução.
     """
-    player: Optional[Any] = None
-    target: Optional[Any] = None
-    game_state: Dict[str, Any] = field(default_factory=dict)
-    ai_config: Dict[str, Any] = field(default_factory=dict)
-    shared_data: Dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=time.time)
+    
+    __slots__ = ('player', 'target', 'game_state', 'ai_config', 'shared_data', 'timestamp')
+    
+    def __init__(self,
+                 player: Optional[Any] = None,
+                 target: Optional[Any] = None,
+                 game_state: Optional[Dict[str, Any]] = None,
+                 ai_config: Optional[Dict[str, Any]] = None,
+                 shared_data: Optional[Dict[str, Any]] = None,
+                 timestamp: Optional[float] = None):
+        """
+        Inicializa contexto.
+        
+        Args:
+            player: Referência ao jogador
+            target: Alvo atual
+            game_state: Estado do jogo
+            ai_config: Configuração da IA
+            shared_data: Dados compartilhados entre tarefas
+            timestamp: Momento de criação (padrão: agora)
+        """
+        self.player = player
+        self.target = target
+        self.game_state = {} if game_state is None else game_state
+        self.ai_config = {} if ai_config is None else ai_config
+        self.shared_data = {} if shared_data is None else shared_data
+        self.timestamp = _time() if timestamp is None else timestamp
+    
+    def __repr__(self) -> str:
+        """Representação para debug."""
+        return (f"TaskContext(player={self.player!r}, target={self.target!r}, "
+                f"game_state={self.game_state!r}, ai_config={self.ai_config!r}, "
+                f"shared_data={self.shared_data!r}, timestamp={self.timestamp!r})")
     
     def get(self, key: str, default: Any = None) -> Any:
         """Obtém valor do contexto."""
@@ -109,8 +191,25 @@ class BaseTask(ABC):
     
     Define interface e comportamento comum para tarefas do sistema.
     Similar ao sistema de comandos do OpenKore mas mais estruturado.
+    
+    Usa __slots__; subclasses sem __slots__ próprio continuam com __dict__.
+    Status e prioridade guardam também o valor bruto do enum, usado nos
+    caminhos consultados a cada tick do agendador.
     """
     
+    __slots__ = (
+        'name', 'task_id', '_description_cache',
+        '_priority', '_priority_value',
+        'timeout', 'max_retries', 'retry_delay', 'auto_retry',
+        '_status', '_status_value', '_status_bit', '_registry', 'retry_count', 'error_message',
+        'created_at', 'started_at', 'completed_at', 'last_update', '_started_ns', '_duration_ns',
+        'parameters', 'result', 'context',
+        'on_start', 'on_progress', 'on_complete', 'on_failure', 'on_retry',
+        'dependencies', 'dependents', '_pending_deps',
+        'logger', '_cancelled', '_pause_event', '_cached_est_duration',
+        '__weakref__'
+    )
+    
     def __init__(self,
                  name: str,
                  priority: TaskPriority = TaskPriority.NORMAL,
@@ -132,8 +231,9 @@ class BaseTask(ABC):
             logger: Logger personalizado
         """
         # Identificação
-        self.name = name
+        self.name = sys.intern(name)
         self.task_id = self._generate_id()
+        self._description_cache: Optional[str] = None
         
         # Configuração
         self.priority = priority
@@ -143,15 +243,22 @@ class BaseTask(ABC):
         self.auto_retry = auto_retry
         
         # Estado
-        self.status = TaskStatus.PENDING
+        self._registry: Optional['TaskRegistry'] = None
+        self._status = _PENDING
+        self._status_value = _PENDING.value
+        self._status_bit = _STATUS_BITS[_PENDING.value]
         self.retry_count = 0
         self.error_message = ""
         
-        # Tempos
-        self.created_at = time.time()
+        # Tempos (uma única leitura do relógio)
+        now = time.time()
+        self.created_at = now
         self.started_at: Optional[float] = None
         self.completed_at: Optional[float] = None
-        self.last_update = time.time()
+        self.last_update = now
+        # Duração medida com relógio monotônico (ns inteiros)
+        self._started_ns: Optional[int] = None
+        self._duration_ns: Optional[int] = None
         
         # Dados
         self.parameters: Dict[str, Any] = {}
@@ -166,19 +273,57 @@ class BaseTask(ABC):
         self.on_retry: Optional[Callable] = None
         
         # Dependências
-        self.dependencies: List['BaseTask'] = []
-        self.dependents: List['BaseTask'] = []
+        self.dependencies: Set['BaseTask'] = set()
+        self.dependents: Set['BaseTask'] = set()
+        self._pending_deps = 0  # Dependências ainda não completadas
         
         # Sistema
-        self.logger = logger or Logger(level="INFO")
+        self.logger = logger or _get_default_logger()
         self._cancelled = False
-        self._pause_event = asyncio.Event()
-        self._pause_event.set()  # Não pausado por padrão
+        self._pause_event: Optional[asyncio.Event] = None  # Criado no primeiro pause()
+        self._cached_est_duration: Optional[float] = None
     
     def _generate_id(self) -> str:
         """Gera ID único para a tarefa."""
-        import uuid
-        return f"{self.name}_{uuid.uuid4().hex[:8]}"
+        return f"{self.name}_{next(_task_counter):08x}"
+    
+    def _get_pause_event(self) -> asyncio.Event:
+        """Obtém evento de pausa, criando-o (sinalizado) no primeiro uso."""
+        if self._pause_event is None:
+            self._pause_event = asyncio.Event()
+            self._pause_event.set()
+        return self._pause_event
+    
+    @property
+    def status(self) -> TaskStatus:
+        """Status atual da tarefa."""
+        return self._status
+    
+    @status.setter
+    def status(self, status: TaskStatus) -> None:
+        value = status.value
+        if self._registry is not None:
+            self._registry._move(self, self._status_value, value)
+        if (self._status is _COMPLETED) is not (status is _COMPLETED):
+            # Mantém o contador de dependências pendentes dos dependentes
+            delta = -1 if status is _COMPLETED else 1
+            for dependent in self.dependents:
+                dependent._pending_deps += delta
+                if not dependent._pending_deps:
+                    dependent._notify_ready()
+        self._status = status
+        self._status_value = value
+        self._status_bit = _STATUS_BITS[value]
+    
+    @property
+    def priority(self) -> TaskPriority:
+        """Prioridade da tarefa."""
+        return self._priority
+    
+    @priority.setter
+    def priority(self, priority: TaskPriority) -> None:
+        self._priority = priority
+        self._priority_value = priority.value
     
     # Métodos abstratos que devem ser implementados
     @abstractmethod
@@ -215,6 +360,22 @@ class BaseTask(ABC):
         """
         return 5.0  # Padrão de 5 segundos
     
+    def _get_cached_estimated_duration(self) -> float:
+        """Obtém duração estimada, calculando-a uma vez até ser invalidada."""
+        estimated = self._cached_est_duration
+        if estimated is None:
+            estimated = self._cached_est_duration = self.get_estimated_duration()
+        return estimated
+    
+    def invalidate_duration_cache(self) -> None:
+        """
+        Descarta a duração estimada em cache.
+        
+        Subclasses com estimativa dinâmica devem chamar quando ela mudar;
+        alterações de parâmetros já invalidam automaticamente.
+        """
+        self._cached_est_duration = None
+    
     def get_description(self) -> str:
         """
         Obtém descrição da tarefa.
@@ -222,7 +383,10 @@ class BaseTask(ABC):
         Returns:
             Descrição da tarefa
         """
-        return f"Tarefa: {self.name}"
+        description = self._description_cache
+        if description is None:
+            description = self._description_cache = f"Tarefa: {self.name}"
+        return description
     
     # Controle de execução
     async def run(self, context: TaskContext) -> TaskResult:
@@ -238,10 +402,7 @@ class BaseTask(ABC):
         try:
             # Verifica se pode executar
             if not self.can_execute(context):
-                self.result = TaskResult(
-                    TaskStatus.SKIPPED,
-                    "Condições não atendidas"
-                )
+                self.result = TaskResult(TaskStatus.SKIPPED, "Condições não atendidas")
                 return self.result
             
             # Inicia execução
@@ -249,12 +410,11 @@ class BaseTask(ABC):
             
             # Executa com timeout
             if self.timeout > 0:
+                # asyncio.timeout (3.11+) não cria uma Task extra como wait_for
                 try:
-                    self.result = await asyncio.wait_for(
-                        self._execute_with_pause_check(context),
-                        timeout=self.timeout
-                    )
-                except asyncio.TimeoutError:
+                    async with asyncio.timeout(self.timeout):
+                        self.result = await self._execute_with_pause_check(context)
+                except TimeoutError:
                     self.result = TaskResult(
                         TaskStatus.TIMEOUT,
                         f"Timeout de {self.timeout}s atingido"
@@ -286,23 +446,41 @@ class BaseTask(ABC):
     
     async def _execute_with_pause_check(self, context: TaskContext) -> TaskResult:
         """Executa com verificação de pausa."""
-        while True:
-            # Verifica se está pausado
-            await self._pause_event.wait()
-            
-            # Verifica se foi cancelado
-            if self._cancelled:
-                return TaskResult(TaskStatus.CANCELLED, "Cancelado")
-            
-            # Executa a tarefa
-            return await self.execute(context)
+        # Verifica se está pausado (só suspende se estiver)
+        pause_event = self._pause_event
+        if pause_event is not None and not pause_event.is_set():
+            await pause_event.wait()
+        
+        # Verifica se foi cancelado
+        if self._cancelled:
+            return TaskResult(TaskStatus.CANCELLED, "Cancelado")
+        
+        # Executa a tarefa
+        return await self.execute(context)
+    
+    async def _check_pause(self) -> bool:
+        """
+        Aguarda enquanto a tarefa estiver pausada.
+        
+        Para uso dentro de execute() em tarefas longas que devem respeitar
+        pause()/resume() entre etapas.
+        
+        Returns:
+            True se a tarefa foi cancelada
+        """
+        pause_event = self._pause_event
+        if pause_event is not None and not pause_event.is_set():
+            await pause_event.wait()
+        return self._cancelled
     
     def _start_execution(self, context: TaskContext) -> None:
         """Inicia execução."""
-        self.status = TaskStatus.RUNNING
-        self.started_at = time.time()
+        self.status = _RUNNING
+        now = _time()
+        self.started_at = now
+        self._started_ns = _perf_counter_ns()
         self.context = context
-        self.last_update = time.time()
+        self.last_update = now
         
         self.logger.debug(f"Iniciando tarefa: {self.name}")
         
@@ -314,10 +492,12 @@ class BaseTask(ABC):
     
     def _finish_execution(self) -> None:
         """Finaliza execução."""
-        self.completed_at = time.time()
+        self.completed_at = _time()
+        if self._started_ns is not None:
+            self._duration_ns = _perf_counter_ns() - self._started_ns
         self.status = self.result.status if self.result else TaskStatus.FAILED
         
-        self.logger.debug(f"Tarefa finalizada: {self.name} - {self.status.value}")
+        self.logger.debug(f"Tarefa finalizada: {self.name} - {self._status_value}")
         
         # Chama callback apropriado
         if self.result and self.result.is_success() and self.on_complete:
@@ -334,35 +514,40 @@ class BaseTask(ABC):
     # Controle de estado
     def pause(self) -> None:
         """Pausa a tarefa."""
-        if self.status == TaskStatus.RUNNING:
-            self.status = TaskStatus.PAUSED
-            self._pause_event.clear()
+        if self._status is _RUNNING:
+            self.status = _PAUSED
+            self._get_pause_event().clear()
             self.logger.debug(f"Tarefa pausada: {self.name}")
     
     def resume(self) -> None:
         """Resume a tarefa."""
-        if self.status == TaskStatus.PAUSED:
-            self.status = TaskStatus.RUNNING
-            self._pause_event.set()
+        if self._status is _PAUSED:
+            self.status = _RUNNING
+            if self._pause_event is not None:
+                self._pause_event.set()
             self.logger.debug(f"Tarefa resumida: {self.name}")
     
     def cancel(self) -> None:
         """Cancela a tarefa."""
         self._cancelled = True
-        self.status = TaskStatus.CANCELLED
-        self._pause_event.set()  # Desbloqueia se estiver pausado
+        self.status = _CANCELLED
+        if self._pause_event is not None:
+            self._pause_event.set()  # Desbloqueia se estiver pausado
         self.logger.debug(f"Tarefa cancelada: {self.name}")
     
     def reset(self) -> None:
         """Reseta a tarefa para estado inicial."""
-        self.status = TaskStatus.PENDING
+        self.status = _PENDING
         self.retry_count = 0
         self.error_message = ""
         self.started_at = None
         self.completed_at = None
+        self._started_ns = None
+        self._duration_ns = None
         self.result = None
         self._cancelled = False
-        self._pause_event.set()
+        if self._pause_event is not None:
+            self._pause_event.set()
         
         self.logger.debug(f"Tarefa resetada: {self.name}")
     
@@ -370,6 +555,7 @@ class BaseTask(ABC):
     def set_parameter(self, key: str, value: Any) -> None:
         """Define parâmetro da tarefa."""
         self.parameters[key] = value
+        self._cached_est_duration = None
     
     def get_parameter(self, key: str, default: Any = None) -> Any:
         """Obtém parâmetro da tarefa."""
@@ -378,6 +564,7 @@ class BaseTask(ABC):
     def update_parameters(self, params: Dict[str, Any]) -> None:
         """Atualiza múltiplos parâmetros."""
         self.parameters.update(params)
+        self._cached_est_duration = None
     
     def set_timeout(self, timeout: float) -> None:
         """Define timeout da tarefa."""
@@ -391,27 +578,43 @@ class BaseTask(ABC):
     def add_dependency(self, task: 'BaseTask') -> None:
         """Adiciona dependência."""
         if task not in self.dependencies:
-            self.dependencies.append(task)
-            task.dependents.append(self)
+            self.dependencies.add(task)
+            task.dependents.add(self)
+            if task._status is not _COMPLETED:
+                self._pending_deps += 1
     
     def remove_dependency(self, task: 'BaseTask') -> None:
         """Remove dependência."""
         if task in self.dependencies:
-            self.dependencies.remove(task)
-            task.dependents.remove(self)
+            self.dependencies.discard(task)
+            task.dependents.discard(self)
+            if task._status is not _COMPLETED:
+                self._pending_deps -= 1
+                if not self._pending_deps:
+                    self._notify_ready()
     
     def has_dependencies_completed(self) -> bool:
         """Verifica se dependências foram completadas."""
-        return all(dep.status == TaskStatus.COMPLETED for dep in self.dependencies)
+        return self._pending_deps == 0
+    
+    def _notify_ready(self) -> None:
+        """Avisa o registro que a última dependência pendente deixou de ser."""
+        registry = self._registry
+        if registry is not None and registry.on_ready is not None:
+            registry.on_ready(self)
     
     # Status e informações
     def get_elapsed_time(self) -> float:
         """Obtém tempo decorrido."""
         if self.started_at is None:
             return 0.0
-        end_time = self.completed_at or time.time()
+        end_time = self.completed_at or _time()
         return end_time - self.started_at
     
+    def get_duration_ns(self) -> Optional[int]:
+        """Obtém duração da última execução em ns (None se não terminou)."""
+        return self._duration_ns
+    
     def get_progress(self) -> float:
         """
         Obtém progresso da tarefa (0.0 a 1.0).
@@ -419,49 +622,52 @@ class BaseTask(ABC):
         Returns:
             Progresso da tarefa
         """
-        if self.status == TaskStatus.COMPLETED:
+        status = self._status
+        if status is _COMPLETED:
             return 1.0
-        elif self.status == TaskStatus.PENDING:
+        elif status is _PENDING:
             return 0.0
         else:
             # Estima baseado no tempo decorrido vs estimado
             elapsed = self.get_elapsed_time()
-            estimated = self.get_estimated_duration()
+            estimated = self._get_cached_estimated_duration()
             return min(elapsed / estimated, 0.99) if estimated > 0 else 0.5
     
     def is_finished(self) -> bool:
         """Verifica se a tarefa terminou."""
-        return self.status in [
-            TaskStatus.COMPLETED,
-            TaskStatus.FAILED,
-            TaskStatus.CANCELLED,
-            TaskStatus.TIMEOUT,
-            TaskStatus.SKIPPED
-        ]
+        return (self._status_bit & _FINISHED_MASK) != 0
     
     def is_active(self) -> bool:
         """Verifica se a tarefa está ativa."""
-        return self.status in [TaskStatus.RUNNING, TaskStatus.PAUSED]
+        return (self._status_bit & _ACTIVE_MASK) != 0
+    
+    def is_failure(self) -> bool:
+        """Verifica se a tarefa terminou em falha (erro ou timeout)."""
+        return (self._status_bit & _FAILURE_MASK) != 0
     
     def can_retry(self) -> bool:
         """Verifica se pode tentar novamente."""
         return (self.auto_retry and
                 self.retry_count < self.max_retries and
-                self.status in [TaskStatus.FAILED, TaskStatus.TIMEOUT])
+                (self._status_bit & _FAILURE_MASK) != 0)
     
     # Informações para debug/monitoramento
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, copy_params: bool = False) -> Dict[str, Any]:
         """
         Converte tarefa para dicionário.
         
+        Args:
+            copy_params: Se True, 'parameters' é uma cópia; por padrão é o
+                próprio dicionário de parâmetros da tarefa (não modificar)
+        
         Returns:
             Dicionário com dados da tarefa
         """
         return {
             'task_id': self.task_id,
             'name': self.name,
-            'status': self.status.value,
-            'priority': self.priority.value,
+            'status': self._status_value,
+            'priority': self._priority_value,
             'progress': self.get_progress(),
             'elapsed_time': self.get_elapsed_time(),
             'retry_count': self.retry_count,
@@ -470,25 +676,16 @@ class BaseTask(ABC):
             'created_at': self.created_at,
             'started_at': self.started_at,
             'completed_at': self.completed_at,
-            'parameters': self.parameters.copy(),
+            'parameters': self.parameters.copy() if copy_params else self.parameters,
             'dependencies_count': len(self.dependencies),
             'dependents_count': len(self.dependents),
             'description': self.get_description(),
-            'estimated_duration': self.get_estimated_duration()
+            'estimated_duration': self._get_cached_estimated_duration()
         }
     
     def get_summary(self) -> str:
         """Obtém resumo da tarefa."""
-        status_icon = {
-            TaskStatus.PENDING: "⏳",
-            TaskStatus.RUNNING: "🏃",
-            TaskStatus.PAUSED: "⏸️",
-            TaskStatus.COMPLETED: "✅",
-            TaskStatus.FAILED: "❌",
-            TaskStatus.CANCELLED: "🚫",
-            TaskStatus.TIMEOUT: "⏰",
-            TaskStatus.SKIPPED: "⏭️"
-        }.get(self.status, "❓")
+        status_icon = _STATUS_ICONS.get(self._status, "❓")
         
         elapsed = self.get_elapsed_time()
         progress = self.get_progress() * 100
@@ -497,22 +694,123 @@ class BaseTask(ABC):
     
     def __str__(self) -> str:
         """Representação string."""
-        return f"Task({self.name}, {self.status.value}, {self.priority.value})"
+        return f"Task({self.name}, {self._status_value}, {self._priority_value})"
     
     def __repr__(self) -> str:
         """Representação para debug."""
         return (f"BaseTask(name='{self.name}', "
-                f"status={self.status.value}, "
-                f"priority={self.priority.value})")
+                f"status={self._status_value}, "
+                f"priority={self._priority_value})")
     
+    # Ordenação por prioridade (maior prioridade primeiro)
     def __lt__(self, other) -> bool:
         """Comparação para ordenação por prioridade."""
-        if not isinstance(other, BaseTask):
+        if other.__class__ is not self.__class__ and not isinstance(other, BaseTask):
+            return NotImplemented
+        return self._priority_value > other._priority_value
+    
+    def __le__(self, other) -> bool:
+        if other.__class__ is not self.__class__ and not isinstance(other, BaseTask):
             return NotImplemented
-        return self.priority.value > other.priority.value  # Maior prioridade primeiro
+        return self._priority_value >= other._priority_value
+    
+    def __gt__(self, other) -> bool:
+        if other.__class__ is not self.__class__ and not isinstance(other, BaseTask):
+            return NotImplemented
+        return self._priority_value < other._priority_value
+    
+    def __ge__(self, other) -> bool:
+        if other.__class__ is not self.__class__ and not isinstance(other, BaseTask):
+            return NotImplemented
+        return self._priority_value <= other._priority_value
     
     def __eq__(self, other) -> bool:
         """Igualdade baseada no ID."""
-        if not isinstance(other, BaseTask):
+        if other.__class__ is not self.__class__ and not isinstance(other, BaseTask):
             return NotImplemented
-        return self.task_id == other.task_id 
\ No newline at end of file
+        return self.task_id == other.task_id
+    
+    def __hash__(self) -> int:
+        """Hash baseado no ID (consistente com __eq__)."""
+        return hash(self.task_id)
+
+
+class TaskRegistry:
+    """
+    Registro de tarefas indexado por status.
+    
+    As tarefas registradas avisam o registro a cada mudança de status, então
+    consultas em lote (finalizadas, ativas, pendente de maior prioridade) leem
+    só o grupo relevante em vez de chamar is_finished() em todas as tarefas.
+    """
+    
+    __slots__ = ('_by_status', 'on_ready')
+    
+    def __init__(self, on_ready: Optional[Callable[[BaseTask], None]] = None):
+        """
+        Inicializa registro vazio.
+        
+        Args:
+            on_ready: Chamado quando uma tarefa registrada fica sem
+                dependências pendentes
+        """
+        self._by_status: Dict[str, Set[BaseTask]] = {s.value: set() for s in TaskStatus}
+        self.on_ready = on_ready
+    
+    def add(self, task: BaseTask) -> None:
+        """Registra tarefa (uma tarefa pertence a no máximo um registro)."""
+        if task._registry is not None:
+            task._registry.remove(task)
+        task._registry = self
+        self._by_status[task._status_value].add(task)
+    
+    def remove(self, task: BaseTask) -> None:
+        """Remove tarefa do registro."""
+        if task._registry is self:
+            task._registry = None
+            self._by_status[task._status_value].discard(task)
+    
+    def _move(self, task: BaseTask, old_value: str, new_value: str) -> None:
+        """Move tarefa entre grupos de status."""
+        if old_value != new_value:
+            self._by_status[old_value].discard(task)
+            self._by_status[new_value].add(task)
+    
+    def __len__(self) -> int:
+        return sum(len(tasks) for tasks in self._by_status.values())
+    
+    def __contains__(self, task) -> bool:
+        return isinstance(task, BaseTask) and task._registry is self
+    
+    def count(self, status: TaskStatus) -> int:
+        """Conta tarefas com o status informado."""
+        return len(self._by_status[status.value])
+    
+    def with_status(self, status: TaskStatus) -> List[BaseTask]:
+        """Obtém tarefas com o status informado."""
+        return list(self._by_status[status.value])
+    
+    def finished(self) -> List[BaseTask]:
+        """Obtém tarefas finalizadas."""
+        return self._with_mask(_FINISHED_MASK)
+    
+    def active(self) -> List[BaseTask]:
+        """Obtém tarefas ativas (executando ou pausadas)."""
+        return self._with_mask(_ACTIVE_MASK)
+    
+    def _with_mask(self, mask: int) -> List[BaseTask]:
+        """Obtém tarefas cujo status está na máscara."""
+        by_status = self._by_status
+        return [task for value, bit in _STATUS_BITS.items() if bit & mask
+                for task in by_status[value]]
+    
+    def highest_priority_pending(self) -> Optional[BaseTask]:
+        """Obtém tarefa pendente de maior prioridade."""
+        pending = self._by_status[TaskStatus.PENDING.value]
+        if not pending:
+            return None
+        return max(pending, key=_priority_key)
+
+
+def _priority_key(task: BaseTask) -> int:
+    return task._priority_value
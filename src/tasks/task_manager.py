@@ -6,15 +6,23 @@ Gerenciador de tarefas do PythonKore.
 """
 
 import time
+import array
+import heapq
 import asyncio
-from typing import Dict, List, Optional, Any, Set
-from collections import defaultdict
+import itertools
+import weakref
+from typing import Dict, List, Optional, Any, Set, Tuple, Type
+from collections import deque
 
-from base_task import BaseTask, TaskStatus, TaskPriority, TaskResult, TaskContext
+from base_task import BaseTask, TaskStatus, TaskPriority, TaskContext, TaskRegistry
 from core.logging.logger import Logger
 from core.events.event_bus import EventBus
 
 
+def _noop(*args, **kwargs) -> None:
+    """Emissor usado quando não há bus de eventos."""
+
+
 class TaskManager:
     """
     Gerenciador de tarefas.
@@ -26,6 +34,17 @@ class TaskManager:
     - Monitorar execução
     """
     
+    __slots__ = (
+        'logger', '_event_bus', '_emit', 'max_concurrent_tasks', 'max_queue_size',
+        '_pending_heap', '_blocked', '_seq', 'running_tasks', 'completed_tasks', 'failed_tasks',
+        '_by_id', '_by_status', 'is_running', 'manager_task', 'cleanup_task', '_wakeup',
+        '_ready_queue', '_workers', '_task_workers', '_cancelled_runs', '_retrying',
+        'global_context',
+        'stats', '_priority_counts', '_execution_count', '_execution_total_ns',
+        '_pool', '_acquired', 'cleanup_interval', 'max_history', 'max_pool_size',
+        '__weakref__'
+    )
+    
     def __init__(self,
                  logger: Optional[Logger] = None,
                  event_bus: Optional[EventBus] = None,
@@ -41,20 +60,38 @@ class TaskManager:
             max_queue_size: Tamanho máximo da fila
         """
         self.logger = logger or Logger(level="INFO")
-        self.event_bus = event_bus
+        self.event_bus = event_bus  # Também define _emit
         self.max_concurrent_tasks = max_concurrent_tasks
         self.max_queue_size = max_queue_size
         
         # Filas de tarefas
-        self.pending_tasks: List[BaseTask] = []
+        # Pendentes ficam num heap de (-prioridade, sequência, tarefa): a
+        # sequência desempata por ordem de chegada
+        self._pending_heap: List[Tuple[int, int, BaseTask]] = []
+        # Aguardando dependências (liberadas quando uma dependência completa)
+        self._blocked: Dict[BaseTask, Tuple[int, int, BaseTask]] = {}
+        self._seq = itertools.count()
         self.running_tasks: Dict[str, BaseTask] = {}
         self.completed_tasks: List[BaseTask] = []
         self.failed_tasks: List[BaseTask] = []
         
+        # Índices de consulta: todas as tarefas conhecidas (pendentes, em
+        # execução e histórico) por ID e agrupadas por status
+        self._by_id: Dict[str, BaseTask] = {}
+        self._by_status = TaskRegistry(on_ready=self._release)
+        
         # Controle de execução
         self.is_running = False
         self.manager_task: Optional[asyncio.Task] = None
-        self.task_futures: Dict[str, asyncio.Task] = {}
+        self.cleanup_task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()  # Acorda o loop principal
+        
+        # Workers fixos (max_concurrent_tasks) consomem as tarefas prontas
+        self._ready_queue: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._task_workers: Dict[str, asyncio.Task] = {}  # task_id -> worker executando
+        self._cancelled_runs: Set[str] = set()  # Execuções canceladas pelo gerenciador
+        self._retrying: Set[str] = set()  # Tarefas aguardando o retry_delay
         
         # Contexto global
         self.global_context = TaskContext()
@@ -66,16 +103,37 @@ class TaskManager:
             'total_failed': 0,
             'total_cancelled': 0,
             'total_timeout': 0,
-            'average_execution_time': 0.0,
-            'tasks_by_priority': defaultdict(int)
+            'average_execution_time': 0.0  # Calculado na leitura (get_status/get_statistics)
         }
+        # Tarefas agendadas por prioridade, indexado pelo valor da prioridade
+        self._priority_counts = array.array('Q', bytes(8 * (max(p.value for p in TaskPriority) + 1)))
+        # Soma inteira das durações (ns): média exata, sem divisão por conclusão
+        self._execution_count = 0
+        self._execution_total_ns = 0
         
         # Configurações
         self.cleanup_interval = 60.0  # Limpeza a cada minuto
         self.max_history = 100  # Máximo de tarefas no histórico
+        self.max_pool_size = 64  # Tarefas recicláveis guardadas por classe
+        
+        # Tarefas que saíram do histórico, por classe, para acquire_task
+        self._pool: Dict[type, deque] = {}
+        # Instâncias entregues por acquire_task: só estas são recicladas
+        self._acquired: 'weakref.WeakSet[BaseTask]' = weakref.WeakSet()
         
         self.logger.info("TaskManager inicializado")
     
+    @property
+    def event_bus(self) -> Optional[EventBus]:
+        """Bus de eventos."""
+        return self._event_bus
+    
+    @event_bus.setter
+    def event_bus(self, event_bus: Optional[EventBus]) -> None:
+        # Sem bus, os pontos de emissão chamam um no-op em vez de testar o bus
+        self._event_bus = event_bus
+        self._emit = event_bus.emit if event_bus is not None else _noop
+    
     def start(self) -> None:
         """Inicia o gerenciador de tarefas."""
         if self.is_running:
@@ -84,11 +142,13 @@ class TaskManager:
         
         self.is_running = True
         self.manager_task = asyncio.create_task(self._manager_loop())
+        self.cleanup_task = asyncio.create_task(self._cleanup_loop())
+        self._workers = [asyncio.create_task(self._worker())
+                         for _ in range(self.max_concurrent_tasks)]
         
         self.logger.info("TaskManager iniciado")
         
-        if self.event_bus:
-            self.event_bus.emit('task_manager_started')
+        self._emit('task_manager_started')
     
     def stop(self) -> None:
         """Para o gerenciador de tarefas."""
@@ -97,14 +157,29 @@ class TaskManager:
         # Cancela task principal
         if self.manager_task and not self.manager_task.done():
             self.manager_task.cancel()
+        if self.cleanup_task and not self.cleanup_task.done():
+            self.cleanup_task.cancel()
         
         # Cancela todas as tarefas em execução
         self.cancel_all_tasks()
         
+        # Encerra workers depois que drenarem a fila
+        for _ in self._workers:
+            self._ready_queue.put_nowait(None)
+        self._workers = []
+        
         self.logger.info("TaskManager parado")
         
-        if self.event_bus:
-            self.event_bus.emit('task_manager_stopped')
+        self._emit('task_manager_stopped')
+    
+    @property
+    def pending_tasks(self) -> List[BaseTask]:
+        """Tarefas pendentes em ordem de prioridade (cópia)."""
+        return [entry[2] for entry in sorted(self._pending_heap + list(self._blocked.values()))]
+    
+    def _pending_count(self) -> int:
+        """Número de tarefas pendentes."""
+        return len(self._pending_heap) + len(self._blocked)
     
     def schedule_task(self, task: BaseTask) -> bool:
         """
@@ -116,66 +191,77 @@ class TaskManager:
         Returns:
             True se agendada com sucesso
         """
-        if len(self.pending_tasks) >= self.max_queue_size:
+        if not self._enqueue(task):
+            return False
+        
+        self._emit('task_scheduled', task=task)
+        return True
+    
+    def _enqueue(self, task: BaseTask) -> bool:
+        """Coloca tarefa na fila sem emitir evento."""
+        if self._pending_count() >= self.max_queue_size:
             self.logger.warning(f"Fila cheia, descartando tarefa: {task.name}")
             return False
         
-        # Adiciona à fila mantendo ordem de prioridade
-        self._insert_by_priority(task)
+        priority = task.priority.value
         
-        self.stats['total_scheduled'] += 1
-        self.stats['tasks_by_priority'][task.priority.value] += 1
+        # Adiciona à fila mantendo ordem de prioridade
+        self._insert_by_priority(task, priority)
+        self._by_id[task.task_id] = task
+        self._by_status.add(task)
         
-        self.logger.debug(f"Tarefa agendada: {task.name} (prioridade: {task.priority.value})")
+        self._wakeup.set()
         
-        if self.event_bus:
-            self.event_bus.emit('task_scheduled', task=task)
+        self.stats['total_scheduled'] += 1
+        self._priority_counts[priority] += 1
         
+        self.logger.debug(f"Tarefa agendada: {task.name} (prioridade: {priority})")
         return True
     
     def schedule_tasks(self, tasks: List[BaseTask]) -> int:
         """
         Agenda múltiplas tarefas.
         
+        Emite um único evento 'tasks_scheduled' com a lista das tarefas
+        agendadas, em vez de um 'task_scheduled' por tarefa.
+        
         Args:
             tasks: Lista de tarefas
             
         Returns:
             Número de tarefas agendadas
         """
-        scheduled = 0
-        for task in tasks:
-            if self.schedule_task(task):
-                scheduled += 1
-        return scheduled
+        scheduled = [task for task in tasks if self._enqueue(task)]
+        if scheduled:
+            self._emit('tasks_scheduled', tasks=scheduled)
+        return len(scheduled)
     
-    def _insert_by_priority(self, task: BaseTask) -> None:
+    def _insert_by_priority(self, task: BaseTask, priority: int) -> None:
         """Insere tarefa mantendo ordem de prioridade."""
-        inserted = False
-        for i, existing in enumerate(self.pending_tasks):
-            if task.priority.value > existing.priority.value:
-                self.pending_tasks.insert(i, task)
-                inserted = True
-                break
-        
-        if not inserted:
-            self.pending_tasks.append(task)
+        entry = (-priority, next(self._seq), task)
+        if task.has_dependencies_completed():
+            heapq.heappush(self._pending_heap, entry)
+        else:
+            # Só entra no heap quando a última dependência completar
+            self._blocked[task] = entry
     
     async def _manager_loop(self) -> None:
-        """Loop principal do gerenciador."""
+        """
+        Loop principal do gerenciador.
+        
+        Não faz polling: dorme até uma tarefa ser agendada, terminar ou ser
+        cancelada.
+        """
+        wakeup = self._wakeup
         try:
             while self.is_running:
-                # Executa próximas tarefas
-                await self._execute_next_tasks()
+                wakeup.clear()
                 
-                # Remove tarefas finalizadas
-                await self._cleanup_finished_tasks()
+                # Entrega próximas tarefas aos workers
+                self._promote_ready()
                 
-                # Limpeza periódica
-                await self._periodic_cleanup()
-                
-                # Aguarda próximo ciclo
-                await asyncio.sleep(0.1)
+                # Aguarda próximo evento
+                await wakeup.wait()
                 
         except asyncio.CancelledError:
             self.logger.info("Task manager loop cancelado")
@@ -183,93 +269,144 @@ class TaskManager:
             self.logger.error(f"Erro no task manager loop: {e}")
             self.is_running = False
     
-    async def _execute_next_tasks(self) -> None:
-        """Executa próximas tarefas disponíveis."""
+    def _promote_ready(self) -> None:
+        """Passa as próximas tarefas prontas para a fila dos workers."""
         # Verifica quantas tarefas podemos iniciar
         available_slots = self.max_concurrent_tasks - len(self.running_tasks)
         
-        if available_slots <= 0 or not self.pending_tasks:
+        heap = self._pending_heap
+        if available_slots <= 0 or not heap:
             return
         
-        # Procura tarefas prontas para execução
+        # Retira tarefas prontas em ordem de prioridade; as que ainda têm
+        # dependências pendentes esperam em _blocked
         tasks_to_start = []
         
-        for task in self.pending_tasks[:]:
-            if len(tasks_to_start) >= available_slots:
-                break
-            
-            # Verifica se dependências foram atendidas
-            if task.has_dependencies_completed():
-                tasks_to_start.append(task)
-                self.pending_tasks.remove(task)
+        while heap and len(tasks_to_start) < available_slots:
+            entry = heapq.heappop(heap)
+            if entry[2].has_dependencies_completed():
+                tasks_to_start.append(entry[2])
+            else:
+                self._blocked[entry[2]] = entry
         
-        # Inicia execução das tarefas
+        # Entrega aos workers
         for task in tasks_to_start:
-            await self._start_task_execution(task)
+            self._start_task_execution(task)
+    
+    def _release(self, task: BaseTask) -> None:
+        """
+        Devolve ao heap tarefa bloqueada que ficou sem dependências pendentes.
+        
+        Chamado pelo registro, seja a dependência completada aqui ou fora do
+        gerenciador, ou removida com remove_dependency.
+        """
+        entry = self._blocked.pop(task, None)
+        if entry is not None:
+            heapq.heappush(self._pending_heap, entry)
+            self._wakeup.set()
     
-    async def _start_task_execution(self, task: BaseTask) -> None:
+    def _start_task_execution(self, task: BaseTask) -> None:
         """Inicia execução de uma tarefa."""
         self.running_tasks[task.task_id] = task
         
-        # Cria future para a tarefa
-        future = asyncio.create_task(task.run(self.global_context))
-        self.task_futures[task.task_id] = future
+        # Um worker livre pega a tarefa (há um worker por slot)
+        self._ready_queue.put_nowait(task)
         
         self.logger.info(f"Iniciando execução: {task.name}")
         
-        if self.event_bus:
-            self.event_bus.emit('task_started', task=task)
+        self._emit('task_started', task=task)
     
-    async def _cleanup_finished_tasks(self) -> None:
-        """Remove tarefas que finalizaram."""
-        finished_tasks = []
-        
-        for task_id, task in self.running_tasks.items():
-            if task.is_finished():
-                finished_tasks.append(task_id)
-        
-        for task_id in finished_tasks:
-            task = self.running_tasks.pop(task_id)
-            future = self.task_futures.pop(task_id, None)
-            
-            if future and not future.done():
-                future.cancel()
-            
-            # Move para lista apropriada
-            if task.status == TaskStatus.COMPLETED:
-                self.completed_tasks.append(task)
-                self.stats['total_completed'] += 1
-            elif task.status in [TaskStatus.FAILED, TaskStatus.TIMEOUT]:
-                self.failed_tasks.append(task)
-                if task.status == TaskStatus.FAILED:
-                    self.stats['total_failed'] += 1
-                else:
-                    self.stats['total_timeout'] += 1
-            elif task.status == TaskStatus.CANCELLED:
-                self.stats['total_cancelled'] += 1
+    async def _worker(self) -> None:
+        """Executa tarefas da fila de prontas até receber None."""
+        worker = asyncio.current_task()
+        queue = self._ready_queue
+        task_workers = self._task_workers
+        
+        while True:
+            task = await queue.get()
+            if task is None:
+                return
             
-            # Atualiza estatísticas
-            self._update_execution_stats(task)
+            # Tarefa cancelada enquanto esperava na fila não executa
+            if not task.is_finished():
+                task_id = task.task_id
+                task_workers[task_id] = worker
+                try:
+                    await task.run(self.global_context)
+                except asyncio.CancelledError:
+                    pass
+                finally:
+                    del task_workers[task_id]
+                
+                # Cancelamento da tarefa (cancel_task) não encerra o worker
+                if task_id in self._cancelled_runs:
+                    self._cancelled_runs.discard(task_id)
+                    worker.uncancel()
             
-            self.logger.debug(f"Tarefa finalizada: {task.name} - {task.status.value}")
+            self._finish_task(task)
             
-            if self.event_bus:
-                self.event_bus.emit('task_finished', task=task)
+            # Cancelamento externo (ex.: encerramento do loop) encerra o worker
+            if worker.cancelling():
+                raise asyncio.CancelledError
+    
+    def _cancel_run(self, task_id: str) -> None:
+        """Interrompe a execução em andamento de uma tarefa."""
+        worker = self._task_workers.get(task_id)
+        if worker is not None and task_id not in self._cancelled_runs:
+            self._cancelled_runs.add(task_id)
+            worker.cancel()
+    
+    def _finish_task(self, task: BaseTask) -> None:
+        """Processa tarefa que terminou de executar."""
+        if self.running_tasks.pop(task.task_id, None) is None:
+            return
+        
+        # Slot livre: acorda o loop para entregar a próxima tarefa
+        self._wakeup.set()
+        
+        # Move para lista apropriada
+        status = task.status
+        if status is TaskStatus.COMPLETED:
+            self.completed_tasks.append(task)
+            self.stats['total_completed'] += 1
+        elif task.is_failure():
+            self.failed_tasks.append(task)
+            if status is TaskStatus.FAILED:
+                self.stats['total_failed'] += 1
+            else:
+                self.stats['total_timeout'] += 1
+        else:
+            # Cancelada ou pulada (can_execute falso: continua PENDING) não
+            # vai ao histórico nem é reexecutada
+            if status is TaskStatus.CANCELLED:
+                self.stats['total_cancelled'] += 1
+            self._forget(task)
+        
+        # Atualiza estatísticas
+        self._update_execution_stats(task)
+        
+        self.logger.debug(f"Tarefa finalizada: {task.name} - {task.status.value}")
+        
+        self._emit('task_finished', task=task)
+        
+        # Verifica se precisa reagendar (retry)
+        if task.can_retry():
+            task.retry_count += 1
+            task.reset()
             
-            # Verifica se precisa reagendar (retry)
-            if task.can_retry():
-                task.retry_count += 1
-                task.reset()
-                
-                # Reagenda após delay
-                if task.retry_delay > 0:
-                    asyncio.create_task(self._schedule_retry(task))
-                else:
-                    self.schedule_task(task)
+            # Reagenda após delay
+            if task.retry_delay > 0:
+                self._retrying.add(task.task_id)
+                asyncio.create_task(self._schedule_retry(task))
+            else:
+                self.schedule_task(task)
     
     async def _schedule_retry(self, task: BaseTask) -> None:
         """Reagenda tarefa após delay."""
-        await asyncio.sleep(task.retry_delay)
+        try:
+            await asyncio.sleep(task.retry_delay)
+        finally:
+            self._retrying.discard(task.task_id)
         self.schedule_task(task)
         
         if task.on_retry:
@@ -280,28 +417,98 @@ class TaskManager:
     
     def _update_execution_stats(self, task: BaseTask) -> None:
         """Atualiza estatísticas de execução."""
-        if task.started_at and task.completed_at:
-            execution_time = task.completed_at - task.started_at
-            
-            # Atualiza média de tempo de execução
-            total_completed = self.stats['total_completed']
-            current_avg = self.stats['average_execution_time']
-            
-            if total_completed > 0:
-                self.stats['average_execution_time'] = (
-                    (current_avg * (total_completed - 1) + execution_time) / total_completed
-                )
-            else:
-                self.stats['average_execution_time'] = execution_time
+        duration_ns = task.get_duration_ns()
+        if duration_ns is not None:
+            self._execution_count += 1
+            self._execution_total_ns += duration_ns
+    
+    async def _cleanup_loop(self) -> None:
+        """Executa a limpeza de histórico a cada cleanup_interval segundos."""
+        try:
+            while self.is_running:
+                await asyncio.sleep(self.cleanup_interval)
+                await self._periodic_cleanup()
+        except asyncio.CancelledError:
+            pass
     
     async def _periodic_cleanup(self) -> None:
         """Limpeza periódica de histórico."""
         # Limita tamanho do histórico
+        evicted: List[BaseTask] = []
+        
         if len(self.completed_tasks) > self.max_history:
+            evicted += self.completed_tasks[:-self.max_history]
             self.completed_tasks = self.completed_tasks[-self.max_history:]
         
         if len(self.failed_tasks) > self.max_history:
+            evicted += self.failed_tasks[:-self.max_history]
             self.failed_tasks = self.failed_tasks[-self.max_history:]
+        
+        if evicted:
+            # Uma tarefa reexecutada pode ter entradas mais novas ainda no
+            # histórico, na fila, em execução ou aguardando o retry
+            kept = {task.task_id for task in self.completed_tasks}
+            kept.update(task.task_id for task in self.failed_tasks)
+            kept.update(self.running_tasks)
+            kept.update(entry[2].task_id for entry in self._pending_heap)
+            kept.update(task.task_id for task in self._blocked)
+            kept.update(self._retrying)
+            for task in evicted:
+                if task.task_id not in kept:
+                    self._by_id.pop(task.task_id, None)
+                    self._by_status.remove(task)
+                    kept.add(task.task_id)  # Pode aparecer em ambas as listas
+                    self._recycle(task)
+    
+    def _recycle(self, task: BaseTask) -> None:
+        """Guarda tarefa retirada do histórico se foi obtida por acquire_task."""
+        if task not in self._acquired:
+            return
+        self._acquired.discard(task)
+        
+        # Desfaz ligações de dependência para a instância não ser alterada
+        # (nem alterar outras) depois de reinicializada
+        for dependent in list(task.dependents):
+            dependent.remove_dependency(task)
+        for dependency in list(task.dependencies):
+            task.remove_dependency(dependency)
+        
+        pool = self._pool.get(type(task))
+        if pool is None:
+            pool = self._pool[type(task)] = deque(maxlen=self.max_pool_size)
+        pool.append(task)
+    
+    def acquire_task(self, cls: Type[BaseTask], *args, **kwargs) -> BaseTask:
+        """
+        Obtém tarefa da classe informada, reaproveitando uma instância antiga.
+        
+        Só as instâncias entregues por aqui são recicladas: ao sair do
+        histórico, a tarefa volta ao pool da sua classe e é reinicializada com
+        __init__ numa próxima chamada. Referências a elas não devem ser
+        mantidas depois que saem do histórico.
+        
+        Args:
+            cls: Classe da tarefa
+            *args, **kwargs: Argumentos do construtor
+            
+        Returns:
+            Tarefa pronta para ser agendada
+        """
+        pool = self._pool.get(cls)
+        if pool:
+            task = pool.pop()
+            task.__init__(*args, **kwargs)
+        else:
+            task = cls(*args, **kwargs)
+        self._acquired.add(task)
+        return task
+    
+    def _forget(self, task: BaseTask) -> None:
+        """Remove dos índices tarefa que saiu do gerenciador sem ir ao histórico."""
+        if task in self.completed_tasks or task in self.failed_tasks:
+            return  # Execução anterior ainda está no histórico
+        self._by_id.pop(task.task_id, None)
+        self._by_status.remove(task)
     
     # Controle de tarefas
     def cancel_task(self, task_id: str) -> bool:
@@ -314,27 +521,35 @@ class TaskManager:
         Returns:
             True se cancelada
         """
-        # Procura na fila pendente
-        for task in self.pending_tasks[:]:
-            if task.task_id == task_id:
-                task.cancel()
-                self.pending_tasks.remove(task)
-                self.stats['total_cancelled'] += 1
-                return True
+        task = self._by_id.get(task_id)
+        if task is None:
+            return False
         
         # Procura nas tarefas em execução
         if task_id in self.running_tasks:
-            task = self.running_tasks[task_id]
             task.cancel()
             
-            # Cancela future
-            future = self.task_futures.get(task_id)
-            if future and not future.done():
-                future.cancel()
+            # Interrompe a execução no worker
+            self._cancel_run(task_id)
             
             return True
         
-        return False
+        # Procura nas filas pendentes
+        if task in self._blocked:
+            del self._blocked[task]
+        else:
+            # Reconstrói o heap uma única vez sem as entradas da tarefa
+            heap = self._pending_heap
+            kept = [entry for entry in heap if entry[2] is not task]
+            if len(kept) == len(heap):
+                return False  # Está apenas no histórico
+            heapq.heapify(kept)
+            self._pending_heap = kept
+        
+        task.cancel()
+        self._forget(task)
+        self.stats['total_cancelled'] += 1
+        return True
     
     def cancel_all_tasks(self) -> int:
         """
@@ -346,21 +561,23 @@ class TaskManager:
         cancelled = 0
         
         # Cancela tarefas pendentes
-        for task in self.pending_tasks[:]:
+        for entry in self._pending_heap:
+            entry[2].cancel()
+            self._forget(entry[2])
+            cancelled += 1
+        for task in self._blocked:
             task.cancel()
+            self._forget(task)
             cancelled += 1
-        self.pending_tasks.clear()
+        self._pending_heap.clear()
+        self._blocked.clear()
         
         # Cancela tarefas em execução
-        for task in self.running_tasks.values():
+        for task_id, task in self.running_tasks.items():
             task.cancel()
+            self._cancel_run(task_id)
             cancelled += 1
         
-        # Cancela futures
-        for future in self.task_futures.values():
-            if not future.done():
-                future.cancel()
-        
         self.stats['total_cancelled'] += cancelled
         return cancelled
     
@@ -380,13 +597,7 @@ class TaskManager:
     
     def get_task(self, task_id: str) -> Optional[BaseTask]:
         """Obtém tarefa por ID."""
-        # Procura em todas as listas
-        for task_list in [self.pending_tasks, list(self.running_tasks.values()),
-                         self.completed_tasks, self.failed_tasks]:
-            for task in task_list:
-                if task.task_id == task_id:
-                    return task
-        return None
+        return self._by_id.get(task_id)
     
     def find_tasks(self, **criteria) -> List[BaseTask]:
         """
@@ -398,10 +609,12 @@ class TaskManager:
         Returns:
             Lista de tarefas que atendem os critérios
         """
-        all_tasks = (self.pending_tasks + 
-                    list(self.running_tasks.values()) +
-                    self.completed_tasks + 
-                    self.failed_tasks)
+        # Com status informado, percorre só o grupo correspondente
+        status = criteria.get('status')
+        if isinstance(status, TaskStatus):
+            all_tasks = self._by_status.with_status(status)
+        else:
+            all_tasks = self._by_id.values()
         
         results = []
         for task in all_tasks:
@@ -430,13 +643,13 @@ class TaskManager:
         """Obtém status do gerenciador."""
         return {
             'running': self.is_running,
-            'pending_tasks': len(self.pending_tasks),
+            'pending_tasks': self._pending_count(),
             'running_tasks': len(self.running_tasks),
             'completed_tasks': len(self.completed_tasks),
             'failed_tasks': len(self.failed_tasks),
             'max_concurrent': self.max_concurrent_tasks,
             'max_queue_size': self.max_queue_size,
-            'stats': self.stats.copy()
+            'stats': self._stats_snapshot()
         }
     
     def get_summary(self) -> List[Dict[str, Any]]:
@@ -476,13 +689,30 @@ class TaskManager:
             'total_cancelled': self.stats['total_cancelled'],
             'total_timeout': self.stats['total_timeout'],
             'success_rate': success_rate,
-            'average_execution_time': self.stats['average_execution_time'],
-            'tasks_by_priority': dict(self.stats['tasks_by_priority']),
-            'current_pending': len(self.pending_tasks),
+            'average_execution_time': self._average_execution_time(),
+            'tasks_by_priority': self._tasks_by_priority(),
+            'current_pending': self._pending_count(),
             'current_running': len(self.running_tasks),
             'uptime': time.time() - (self.global_context.timestamp if self.global_context else time.time())
         }
     
+    def _average_execution_time(self) -> float:
+        """Média das durações de execução em segundos."""
+        self.stats['average_execution_time'] = average = (
+            self._execution_total_ns / self._execution_count / 1e9 if self._execution_count else 0.0
+        )
+        return average
+    
+    def _stats_snapshot(self) -> Dict[str, Any]:
+        """Cópia de stats com os valores calculados na leitura."""
+        self._average_execution_time()
+        return {**self.stats, 'tasks_by_priority': self._tasks_by_priority()}
+    
+    def _tasks_by_priority(self) -> Dict[int, int]:
+        """Converte contadores por prioridade em dicionário (só prioridades usadas)."""
+        counts = self._priority_counts
+        return {p.value: counts[p.value] for p in TaskPriority if counts[p.value]}
+    
     # Contexto global
     def set_global_context(self, key: str, value: Any) -> None:
         """Define valor no contexto global."""
@@ -498,13 +728,13 @@ class TaskManager:
     
     def __len__(self) -> int:
         """Número total de tarefas."""
-        return (len(self.pending_tasks) + 
+        return (self._pending_count() + 
                 len(self.running_tasks) + 
                 len(self.completed_tasks) + 
                 len(self.failed_tasks))
     
     def __str__(self) -> str:
         """Representação string."""
-        return (f"TaskManager(pending: {len(self.pending_tasks)}, "
+        return (f"TaskManager(pending: {self._pending_count()}, "
                 f"running: {len(self.running_tasks)}, "
                 f"completed: {len(self.completed_tasks)})") 
\ No newline at end of file
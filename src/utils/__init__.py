@@ -5,10 +5,11 @@ Utils System
 Sistema de utilidades e ferramentas do PythonKore.
 """
 
-from math_utils import MathUtils
+from math_utils import MathUtils, RunningStats, WeightedChoice, in_range, in_range_mask
 from string_utils import StringUtils
 from time_utils import TimeUtils
 # from file_utils import FileUtils
 # from crypto_utils import CryptoUtils
 
-__all__ = ['MathUtils', 'StringUtils', 'TimeUtils'] 
\ No newline at end of file
+__all__ = ['MathUtils', 'RunningStats', 'WeightedChoice', 'in_range', 'in_range_mask',
+           'StringUtils', 'TimeUtils'] 
\ No newline at end of file
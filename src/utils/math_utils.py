@@ -7,7 +7,77 @@ Utilidades matemáticas para o PythonKore.
 
 import math
 import random
-from typing import List, Tuple, Union, Optional
+from bisect import bisect_left
+from itertools import accumulate
+from operator import mul, sub
+from typing import List, Tuple, Union, Sequence
+
+
+_TWO_PI = 2.0 * math.pi
+
+# Métodos da instância compartilhada do módulo random (random.seed continua
+# valendo), ligados uma vez para evitar a busca no módulo a cada sorteio
+_random = random.random
+_uniform = random.uniform
+_randint = random.randint
+
+# A partir deste tamanho a seleção O(n) supera sorted() (Timsort em C)
+_SELECT_MIN_SIZE = 32768
+
+
+def _select(values: List[Union[int, float]], k: int) -> Union[int, float]:
+    """Obtém o k-ésimo menor valor (quickselect com pivô aleatório)."""
+    while len(values) > 64:
+        pivot = values[random.randrange(len(values))]
+        lows = [v for v in values if v < pivot]
+        if k < len(lows):
+            values = lows
+            continue
+        highs = [v for v in values if v > pivot]
+        equal = len(values) - len(lows) - len(highs)
+        if k < len(lows) + equal:
+            return pivot
+        k -= len(lows) + equal
+        values = highs
+    return sorted(values)[k]
+
+
+def in_range(x1: int, y1: int, x2: int, y2: int, range_distance: int) -> bool:
+    """
+    Verifica se está no alcance (distância Chebyshev).
+    
+    Versão de módulo de MathUtils.is_in_range para laços quentes: evita a
+    busca na classe e as chamadas a max/abs.
+    
+    Args:
+        x1, y1: Posição 1
+        x2, y2: Posição 2
+        range_distance: Alcance
+        
+    Returns:
+        True se estiver no alcance
+    """
+    dx = x1 - x2
+    dy = y1 - y2
+    return -range_distance <= dx <= range_distance and -range_distance <= dy <= range_distance
+
+
+def in_range_mask(xs: Sequence[int], ys: Sequence[int],
+                  px: int, py: int, range_distance: int) -> List[bool]:
+    """
+    Verifica quais posições estão no alcance de um ponto.
+    
+    Args:
+        xs, ys: Coordenadas das posições (ex.: monstros)
+        px, py: Ponto de referência (ex.: jogador)
+        range_distance: Alcance
+        
+    Returns:
+        Lista com True para as posições no alcance
+    """
+    min_x, max_x = px - range_distance, px + range_distance
+    min_y, max_y = py - range_distance, py + range_distance
+    return [min_x <= x <= max_x and min_y <= y <= max_y for x, y in zip(xs, ys)]
 
 
 class MathUtils:
@@ -65,6 +135,58 @@ class MathUtils:
         """
         return max(abs(x2 - x1), abs(y2 - y1))
     
+    # Versões em lote: a iteração roda em C (map/zip), sem uma chamada
+    # Python por elemento
+    @staticmethod
+    def distance_2d_batch(x1s: Sequence[float], y1s: Sequence[float],
+                          x2s: Sequence[float], y2s: Sequence[float]) -> List[float]:
+        """
+        Calcula distâncias euclidianas 2D par a par.
+        
+        Args:
+            x1s, y1s: Coordenadas dos pontos 1
+            x2s, y2s: Coordenadas dos pontos 2
+            
+        Returns:
+            Lista de distâncias
+        """
+        return list(map(math.hypot, map(sub, x2s, x1s), map(sub, y2s, y1s)))
+    
+    @staticmethod
+    def chebyshev_batch(x1s: Sequence[int], y1s: Sequence[int],
+                        x2s: Sequence[int], y2s: Sequence[int]) -> List[int]:
+        """
+        Calcula distâncias Chebyshev par a par.
+        
+        Args:
+            x1s, y1s: Coordenadas dos pontos 1
+            x2s, y2s: Coordenadas dos pontos 2
+            
+        Returns:
+            Lista de distâncias
+        """
+        return list(map(max,
+                        map(abs, map(sub, x2s, x1s)),
+                        map(abs, map(sub, y2s, y1s))))
+    
+    @staticmethod
+    def in_range_batch(x1s: Sequence[int], y1s: Sequence[int],
+                       x2s: Sequence[int], y2s: Sequence[int],
+                       range_distance: int) -> List[bool]:
+        """
+        Verifica alcance par a par (distância Chebyshev).
+        
+        Args:
+            x1s, y1s: Posições 1
+            x2s, y2s: Posições 2
+            range_distance: Alcance
+            
+        Returns:
+            Lista com True para os pares no alcance
+        """
+        return [d <= range_distance
+                for d in MathUtils.chebyshev_batch(x1s, y1s, x2s, y2s)]
+    
     @staticmethod
     def angle_between_points(x1: float, y1: float, x2: float, y2: float) -> float:
         """
@@ -90,10 +212,12 @@ class MathUtils:
         Returns:
             Ângulo normalizado
         """
-        while angle < 0:
-            angle += 2 * math.pi
-        while angle >= 2 * math.pi:
-            angle -= 2 * math.pi
+        # fmod é exato e O(1) para qualquer magnitude
+        angle = math.fmod(angle, _TWO_PI)
+        if angle < 0.0:
+            angle += _TWO_PI
+            if angle >= _TWO_PI:  # Negativo ínfimo arredonda para 2π
+                angle = 0.0
         return angle
     
     @staticmethod
@@ -124,7 +248,9 @@ class MathUtils:
         Returns:
             Valor limitado
         """
-        return max(min_val, min(value, max_val))
+        # Mesma semântica de max(min_val, min(value, max_val)), sem chamadas
+        value = max_val if max_val < value else value
+        return value if value > min_val else min_val
     
     @staticmethod
     def percentage(value: float, total: float) -> float:
@@ -171,8 +297,17 @@ class MathUtils:
         if not values:
             return 0.0
         
+        n = len(values)
+        if n >= _SELECT_MIN_SIZE:
+            # Seleção O(n) em vez de ordenar tudo
+            upper = _select(values, n // 2)
+            if n % 2:
+                return upper
+            lows = [v for v in values if v < upper]
+            lower = max(lows) if len(lows) >= n // 2 else upper
+            return (lower + upper) / 2
+        
         sorted_values = sorted(values)
-        n = len(sorted_values)
         
         if n % 2 == 0:
             return (sorted_values[n // 2 - 1] + sorted_values[n // 2]) / 2
@@ -190,12 +325,14 @@ class MathUtils:
         Returns:
             Desvio padrão
         """
-        if len(values) < 2:
+        n = len(values)
+        if n < 2:
             return 0.0
         
-        avg = MathUtils.average(values)
-        variance = sum((x - avg) ** 2 for x in values) / (len(values) - 1)
-        return math.sqrt(variance)
+        # Soma dos quadrados dos desvios em C (map/mul), sem potência por item
+        avg = sum(values) / n
+        deviations = [x - avg for x in values]
+        return math.sqrt(sum(map(mul, deviations, deviations)) / (n - 1))
     
     @staticmethod
     def random_range(min_val: Union[int, float], max_val: Union[int, float]) -> Union[int, float]:
@@ -210,9 +347,9 @@ class MathUtils:
             Número aleatório
         """
         if isinstance(min_val, int) and isinstance(max_val, int):
-            return random.randint(min_val, max_val)
+            return _randint(min_val, max_val)
         else:
-            return random.uniform(min_val, max_val)
+            return _uniform(min_val, max_val)
     
     @staticmethod
     def random_bool(probability: float = 0.5) -> bool:
@@ -225,7 +362,7 @@ class MathUtils:
         Returns:
             Booleano aleatório
         """
-        return random.random() < probability
+        return _random() < probability
     
     @staticmethod
     def weighted_choice(choices: List[Tuple[any, float]]) -> any:
@@ -241,19 +378,8 @@ class MathUtils:
         if not choices:
             return None
         
-        total_weight = sum(weight for _, weight in choices)
-        if total_weight <= 0:
-            return random.choice([item for item, _ in choices])
-        
-        r = random.uniform(0, total_weight)
-        current_weight = 0
-        
-        for item, weight in choices:
-            current_weight += weight
-            if r <= current_weight:
-                return item
-        
-        return choices[-1][0]  # Fallback
+        # Para tabelas fixas, prefira manter um WeightedChoice
+        return WeightedChoice(choices).pick()
     
     # Funções específicas do RO
     @staticmethod
@@ -292,7 +418,29 @@ class MathUtils:
             Dano com variação
         """
         variance = base_damage * (variance_percent / 100.0)
-        return int(base_damage + random.uniform(-variance, variance))
+        return int(base_damage + _uniform(-variance, variance))
+    
+    @staticmethod
+    def damage_variance_batch(base_damages: Sequence[int], variance_percent: float = 5.0) -> List[int]:
+        """
+        Calcula variação de dano para vários golpes/alvos.
+        
+        Mesma distribuição de calculate_damage_variance (uniform inlinado).
+        
+        Args:
+            base_damages: Danos base
+            variance_percent: Percentual de variação
+            
+        Returns:
+            Lista de danos com variação
+        """
+        factor = variance_percent / 100.0
+        rand = _random
+        result = []
+        for base_damage in base_damages:
+            variance = base_damage * factor
+            result.append(int(base_damage + (-variance + (variance + variance) * rand())))
+        return result
     
     @staticmethod
     def calculate_hit_rate(accuracy: int, flee: int) -> float:
@@ -310,7 +458,10 @@ class MathUtils:
             return 0.0
         
         hit_rate = (accuracy - flee) / accuracy
-        return MathUtils.clamp(hit_rate, 0.05, 0.95)  # Min 5%, Max 95%
+        
+        # Min 5%, Max 95% (clamp inline)
+        hit_rate = 0.95 if 0.95 < hit_rate else hit_rate
+        return hit_rate if hit_rate > 0.05 else 0.05
     
     @staticmethod
     def calculate_critical_rate(luk: int, critical_bonus: int = 0) -> float:
@@ -325,8 +476,11 @@ class MathUtils:
             Taxa de crítico (0.0 a 1.0)
         """
         base_crit = luk * 0.3  # Fórmula simplificada
-        total_crit = base_crit + critical_bonus
-        return MathUtils.clamp(total_crit / 100.0, 0.01, 0.5)  # Min 1%, Max 50%
+        total_crit = (base_crit + critical_bonus) / 100.0
+        
+        # Min 1%, Max 50% (clamp inline)
+        total_crit = 0.5 if 0.5 < total_crit else total_crit
+        return total_crit if total_crit > 0.01 else 0.01
     
     @staticmethod
     def calculate_aspd(agi: int, dex: int, weapon_delay: int) -> float:
@@ -345,10 +499,11 @@ class MathUtils:
             return 200.0  # ASPD máximo
         
         # Fórmula simplificada do RO
-        aspd_bonus = (agi + dex) * 0.5
-        base_aspd = 200 - weapon_delay
+        aspd = 200 - weapon_delay + (agi + dex) * 0.5
         
-        return MathUtils.clamp(base_aspd + aspd_bonus, 100, 200)
+        # Entre 100 e 200 (clamp inline)
+        aspd = 200 if 200 < aspd else aspd
+        return aspd if aspd > 100 else 100
     
     @staticmethod
     def is_in_range(x1: int, y1: int, x2: int, y2: int, range_distance: int) -> bool:
@@ -363,7 +518,9 @@ class MathUtils:
         Returns:
             True se estiver no alcance
         """
-        return MathUtils.chebyshev_distance(x1, y1, x2, y2) <= range_distance
+        dx = x1 - x2
+        dy = y1 - y2
+        return -range_distance <= dx <= range_distance and -range_distance <= dy <= range_distance
     
     @staticmethod
     def round_to_nearest(value: float, nearest: float) -> float:
@@ -377,4 +534,93 @@ class MathUtils:
         Returns:
             Valor arredondado
         """
-        return round(value / nearest) * nearest 
\ No newline at end of file
+        return round(value / nearest) * nearest
+
+
+class RunningStats:
+    """
+    Estatísticas incrementais (algoritmo de Welford).
+    
+    Atualiza média e variância a cada valor em O(1), numericamente
+    estável, sem guardar a série.
+    """
+    
+    __slots__ = ('count', 'mean', '_m2')
+    
+    def __init__(self):
+        """Inicializa estatísticas vazias."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def push(self, value: Union[int, float]) -> None:
+        """Adiciona um valor."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+    
+    def push_many(self, values: Sequence[Union[int, float]]) -> None:
+        """Adiciona vários valores."""
+        for value in values:
+            self.push(value)
+    
+    def variance(self) -> float:
+        """Variância amostral (0.0 com menos de 2 valores)."""
+        if self.count < 2:
+            return 0.0
+        return self._m2 / (self.count - 1)
+    
+    def standard_deviation(self) -> float:
+        """Desvio padrão amostral (0.0 com menos de 2 valores)."""
+        return math.sqrt(self.variance())
+    
+    def reset(self) -> None:
+        """Descarta os valores acumulados."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+class WeightedChoice:
+    """
+    Tabela de escolha ponderada reutilizável.
+    
+    Calcula os pesos acumulados uma vez; cada sorteio é uma busca binária
+    (O(log n)) em vez de somar a tabela inteira. Pesos devem ser >= 0.
+    """
+    
+    __slots__ = ('_items', '_cumulative', '_total')
+    
+    def __init__(self, choices: List[Tuple[any, float]]):
+        """
+        Inicializa tabela.
+        
+        Args:
+            choices: Lista de (item, peso)
+        """
+        self._items = [item for item, _ in choices]
+        self._cumulative = list(accumulate(weight for _, weight in choices))
+        self._total = self._cumulative[-1] if self._cumulative else 0
+    
+    def pick(self) -> any:
+        """
+        Sorteia um item.
+        
+        Returns:
+            Item escolhido (None se a tabela estiver vazia)
+        """
+        items = self._items
+        if not items:
+            return None
+        if self._total <= 0:
+            return random.choice(items)
+        
+        index = bisect_left(self._cumulative, _random() * self._total)
+        return items[index] if index < len(items) else items[-1]
+    
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,177 @@
+"""
+Testes para Auto Response
+=========================
+
+Testes unitários para auto_response.py
+"""
+
+import pytest
+import re
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+# Adiciona src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from plugins.builtin.auto_response import AutoResponsePlugin
+from core.logging.logger import Logger
+from core.events.event_bus import EventBus
+
+
+class TestAutoResponseMatching:
+    """Testes para a escolha do padrão que responde."""
+    
+    @pytest.fixture
+    def event_bus(self):
+        """Event bus mock para capturar respostas."""
+        return Mock(spec=EventBus)
+    
+    @pytest.fixture
+    def make_plugin(self, event_bus):
+        """Cria plugin carregado com as respostas informadas."""
+        def factory(responses):
+            plugin = AutoResponsePlugin(logger=Mock(spec=Logger), event_bus=event_bus)
+            plugin.config.update({'responses': responses, 'cooldown': 0, 'use_re2': False})
+            assert plugin.load()
+            return plugin
+        return factory
+    
+    @pytest.fixture
+    def reply(self, event_bus):
+        """Envia mensagem ao plugin e retorna a resposta (ou None)."""
+        def send(plugin, message):
+            event_bus.emit.reset_mock()
+            plugin._handle_message('public', {'message': message, 'player': 'Tester'})
+            if not event_bus.emit.called:
+                return None
+            event_name, data = event_bus.emit.call_args.args
+            assert event_name == 'send_chat_message'
+            return data['message']
+        return send
+    
+    def test_combined_pattern(self, make_plugin, reply):
+        """Testa que padrões regex são combinados em uma alternação."""
+        plugin = make_plugin({
+            r'(?i)what.*level': ['level'],
+            r'(?i)where.*you': ['map'],
+        })
+        
+        assert plugin._master_pattern is not None
+        assert reply(plugin, "What is your level?") == 'level'
+        assert reply(plugin, "where are you") == 'map'
+        assert reply(plugin, "nothing here") is None
+    
+    def test_config_order_wins_over_position(self, make_plugin, reply):
+        """Testa que vale o primeiro padrão da configuração, não o mais à esquerda."""
+        plugin = make_plugin({
+            r'(?i)b.e': ['first'],
+            r'(?i)h.': ['second'],
+        })
+        
+        assert reply(plugin, "hi bye") == 'first'
+        assert reply(plugin, "hi") == 'second'
+    
+    def test_literal_triggers_config_order(self, make_plugin, reply):
+        """Testa gatilhos literais em ordem de configuração."""
+        plugin = make_plugin({
+            r'(?i)bye': ['first'],
+            r'(?i)hi|hello': ['second'],
+        })
+        
+        assert not plugin._searches  # Nenhum padrão passa pelo regex
+        assert reply(plugin, "hi bye") == 'first'
+        assert reply(plugin, "HELLO") == 'second'
+    
+    def test_literal_and_regex_order(self, make_plugin, reply):
+        """Testa prioridade entre gatilhos literais e padrões regex."""
+        regex_first = make_plugin({
+            r'(?i)what.*level': ['regex'],
+            r'(?i)hi': ['literal'],
+        })
+        literal_first = make_plugin({
+            r'(?i)hi': ['literal'],
+            r'(?i)what.*level': ['regex'],
+        })
+        
+        assert reply(regex_first, "hi, what level?") == 'regex'
+        assert reply(literal_first, "hi, what level?") == 'literal'
+        assert reply(regex_first, "hi there") == 'literal'
+    
+    def test_literal_substring_semantics(self, make_plugin, reply):
+        """Testa que gatilho literal casa como substring, igual ao regex."""
+        plugin = make_plugin({r'(?i)hi': ['hi']})
+        
+        assert reply(plugin, "this") == 'hi'
+    
+    def test_case_sensitive_pattern(self, make_plugin, reply):
+        """Testa que padrão sem (?i) continua diferenciando maiúsculas."""
+        plugin = make_plugin({
+            r'Hello': ['exact'],
+            r'(?i)what.*level': ['level'],
+        })
+        
+        assert reply(plugin, "Hello") == 'exact'
+        assert reply(plugin, "hello") is None
+    
+    def test_inline_flags(self, make_plugin, reply):
+        """Testa padrões com flags inline além de (?i)."""
+        plugin = make_plugin({
+            r'(?i)(?x) he llo': ['verbose'],
+            r'(?s)a.b': ['dotall'],
+        })
+        
+        assert reply(plugin, "HELLO") == 'verbose'
+        assert reply(plugin, "a\nb") == 'dotall'
+    
+    def test_invalid_pattern_skipped(self, make_plugin, reply):
+        """Testa que padrão inválido não impede os demais."""
+        plugin = make_plugin({
+            r'(?i)what(': ['broken'],
+            r'(?i)where.*you': ['map'],
+        })
+        
+        assert plugin.get_statistics()['total_patterns'] == 1
+        assert reply(plugin, "where are you") == 'map'
+    
+    def test_sequential_fallback(self, make_plugin, reply):
+        """Testa busca sequencial quando os padrões não podem ser combinados."""
+        plugin = make_plugin({
+            r'(?P<word>bye)': ['first'],
+            r'(?P<word>hi)': ['second'],
+        })
+        
+        assert plugin._master_pattern is None
+        assert reply(plugin, "hi bye") == 'first'
+        assert reply(plugin, "hi") == 'second'
+    
+    def test_numbered_backreference(self, make_plugin, reply):
+        """Testa padrão com referência a grupo por número (fora da alternação)."""
+        plugin = make_plugin({
+            r'hello': ['hello'],
+            r'(\w)\1{3}': ['spam'],
+            r'(?i)z': ['z'],
+        })
+        
+        assert plugin._master_pattern is not None
+        assert reply(plugin, "zzzz") == 'spam'
+        assert reply(plugin, "hello zzzz") == 'hello'
+        assert reply(plugin, "zzz") == 'z'
+        assert reply(plugin, "abcd") is None
+    
+    def test_matches_sequential_search(self, make_plugin, reply):
+        """Testa que a resposta é a do primeiro padrão que re.search encontra."""
+        patterns = [
+            r'(?i)bye|ok', r'Hello', r'(?i)what.*level', r'lvl\d+',
+            r'(?i)you', r'(?i)hi|hello', r'(?i)^bye', r'(\w)\1{3}', r'x{2}',
+        ]
+        messages = [
+            "hello", "Hello you", "OK bye", "what is your level", "lvl42 xx",
+            "bye", "say bye", "hi", "ſtop", "İs it you", "nothing", "xx", "zzzz",
+        ]
+        plugin = make_plugin({pattern: [str(i)] for i, pattern in enumerate(patterns)})
+        
+        for message in messages:
+            expected = next((str(i) for i, pattern in enumerate(patterns)
+                             if re.search(pattern, message)), None)
+            assert reply(plugin, message) == expected, message
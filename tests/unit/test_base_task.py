@@ -0,0 +1,158 @@
+"""
+Testes para Base Task
+=====================
+
+Testes unitários para base_task.py
+"""
+
+import pytest
+import json
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+# Adiciona src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from tasks.base_task import BaseTask, TaskResult, TaskStatus
+from core.logging.logger import Logger
+
+
+class SimpleTask(BaseTask):
+    """Tarefa mínima para testes."""
+    
+    def __init__(self, name, **kwargs):
+        kwargs.setdefault('logger', Mock(spec=Logger))
+        super().__init__(name, **kwargs)
+    
+    async def execute(self, context):
+        return TaskResult(TaskStatus.COMPLETED)
+
+
+class TestPendingDependencies:
+    """Testes para o contador de dependências pendentes."""
+    
+    @pytest.fixture
+    def task(self):
+        """Tarefa dependente."""
+        return SimpleTask("task")
+    
+    @pytest.fixture
+    def dependency(self):
+        """Dependência ainda pendente."""
+        return SimpleTask("dependency")
+    
+    def test_no_dependencies(self, task):
+        """Testa tarefa sem dependências."""
+        assert task._pending_deps == 0
+        assert task.has_dependencies_completed()
+    
+    def test_add_pending_dependency(self, task, dependency):
+        """Testa que dependência pendente incrementa o contador."""
+        task.add_dependency(dependency)
+        
+        assert task._pending_deps == 1
+        assert not task.has_dependencies_completed()
+        assert task in dependency.dependents
+    
+    def test_add_dependency_twice(self, task, dependency):
+        """Testa que a mesma dependência conta uma vez."""
+        task.add_dependency(dependency)
+        task.add_dependency(dependency)
+        
+        assert task._pending_deps == 1
+    
+    def test_add_completed_dependency(self, task, dependency):
+        """Testa que dependência já completada não conta."""
+        dependency.status = TaskStatus.COMPLETED
+        task.add_dependency(dependency)
+        
+        assert task._pending_deps == 0
+        assert task.has_dependencies_completed()
+    
+    def test_dependency_completes(self, task, dependency):
+        """Testa que completar a dependência libera o dependente."""
+        other = SimpleTask("other")
+        task.add_dependency(dependency)
+        task.add_dependency(other)
+        
+        dependency.status = TaskStatus.RUNNING
+        assert task._pending_deps == 2
+        
+        dependency.status = TaskStatus.COMPLETED
+        assert task._pending_deps == 1
+        assert not task.has_dependencies_completed()
+        
+        other.status = TaskStatus.COMPLETED
+        assert task._pending_deps == 0
+        assert task.has_dependencies_completed()
+    
+    def test_completed_dependency_reset(self, task, dependency):
+        """Testa que dependência completada que volta a pendente conta de novo."""
+        task.add_dependency(dependency)
+        dependency.status = TaskStatus.COMPLETED
+        
+        dependency.reset()
+        
+        assert task._pending_deps == 1
+        assert not task.has_dependencies_completed()
+    
+    def test_failed_dependency_stays_pending(self, task, dependency):
+        """Testa que dependência que falhou não libera o dependente."""
+        task.add_dependency(dependency)
+        
+        for status in (TaskStatus.FAILED, TaskStatus.TIMEOUT,
+                       TaskStatus.CANCELLED, TaskStatus.SKIPPED):
+            dependency.status = status
+            assert task._pending_deps == 1
+    
+    def test_remove_pending_dependency(self, task, dependency):
+        """Testa que remover dependência pendente decrementa o contador."""
+        task.add_dependency(dependency)
+        task.remove_dependency(dependency)
+        
+        assert task._pending_deps == 0
+        assert task not in dependency.dependents
+        
+        # Remover de novo não altera o contador
+        task.remove_dependency(dependency)
+        assert task._pending_deps == 0
+    
+    def test_remove_completed_dependency(self, task, dependency):
+        """Testa que remover dependência completada mantém o contador."""
+        pending = SimpleTask("pending")
+        task.add_dependency(dependency)
+        task.add_dependency(pending)
+        dependency.status = TaskStatus.COMPLETED
+        
+        task.remove_dependency(dependency)
+        
+        assert task._pending_deps == 1
+        
+        # Mudanças na dependência removida não afetam mais o dependente
+        dependency.reset()
+        assert task._pending_deps == 1
+
+
+class TestToDict:
+    """Testes para a conversão da tarefa em dicionário."""
+    
+    def test_json_serializable(self):
+        """Testa que o dicionário pode ser serializado em JSON."""
+        task = SimpleTask("task")
+        task.set_parameter('target', 'Poring')
+        
+        data = json.loads(json.dumps(task.to_dict()))
+        
+        assert data['parameters'] == {'target': 'Poring'}
+        assert data['status'] == TaskStatus.PENDING.value
+    
+    def test_copy_params(self):
+        """Testa cópia dos parâmetros com copy_params=True."""
+        task = SimpleTask("task")
+        task.set_parameter('target', 'Poring')
+        
+        params = task.to_dict(copy_params=True)['parameters']
+        params['target'] = 'Fabre'
+        
+        assert task.get_parameter('target') == 'Poring'
@@ -0,0 +1,299 @@
+"""
+Testes para Item Logger
+=======================
+
+Testes unitários para item_logger.py
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Adiciona src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from plugins.builtin.item_logger import ItemEvent, ItemEventColumns
+
+
+def make_event(timestamp_ns, item_name="Jellopy", event_type="drop",
+               quantity=1, monster_name="Poring", map_name="prontera"):
+    """Cria evento de item para testes."""
+    return ItemEvent(
+        timestamp_ns=timestamp_ns,
+        event_type=event_type,
+        item_name=item_name,
+        item_id=909,
+        quantity=quantity,
+        map_name=map_name,
+        coordinates=(150, 180),
+        monster_name=monster_name
+    )
+
+
+class TestItemEventColumns:
+    """Testes para o armazenamento colunar dos eventos."""
+    
+    @pytest.fixture
+    def columns(self):
+        """Colunas com capacidade para 4 eventos."""
+        return ItemEventColumns(4)
+    
+    def test_empty(self, columns):
+        """Testa colunas vazias."""
+        assert len(columns) == 0
+        assert list(columns.slots()) == []
+        assert columns.select(columns.slots()) == []
+    
+    def test_append_and_get(self, columns):
+        """Testa que o evento materializado é igual ao inserido."""
+        event = make_event(1000, quantity=3)
+        event.npc_name = "Tool Dealer"
+        event.price = 50
+        
+        columns.append(event)
+        
+        assert len(columns) == 1
+        assert columns.get(0) == event
+    
+    def test_type_codes(self, columns):
+        """Testa códigos estáveis por tipo de evento."""
+        drop = columns.get_type_code("drop")
+        sold = columns.get_type_code("sold")
+        
+        assert drop != sold
+        assert columns.get_type_code("drop") == drop
+        assert columns.type_names[sold] == "sold"
+    
+    def test_chronological_order(self, columns):
+        """Testa slots e colunas em ordem de inserção."""
+        events = [make_event(ts) for ts in (10, 20, 30)]
+        for event in events:
+            columns.append(event)
+        
+        assert columns.select(columns.slots()) == events
+        assert list(columns.ordered(columns.timestamps_ns)) == [10, 20, 30]
+    
+    def test_clear(self, columns):
+        """Testa remoção de todos os eventos."""
+        columns.append(make_event(10))
+        columns.clear()
+        
+        assert len(columns) == 0
+        assert columns.capacity == 4
+        assert not columns.item_counts
+    
+    def test_missing_numeric_fields(self, columns):
+        """Testa campos numéricos ausentes ou em outro tipo."""
+        event = make_event(10)
+        event.item_id = None
+        event.quantity = 2.0
+        columns.append(event)
+        
+        other = make_event(20)
+        other.item_id = "909"
+        other.quantity = None
+        columns.append(other)
+        
+        stored = columns.select(columns.slots())
+        assert [(e.item_id, e.quantity) for e in stored] == [(0, 2), (909, 0)]
+        assert columns.item_quantities["Jellopy"] == 2
+    
+    @pytest.mark.parametrize("field, value, error", [
+        ("item_id", "abc", ValueError),
+        ("quantity", [1], TypeError),
+        ("item_id", 1 << 70, OverflowError),
+    ])
+    def test_invalid_value_keeps_buffer(self, columns, field, value, error):
+        """Testa que valor inválido não altera o ring buffer, cheio ou não."""
+        for ts in range(10, 50, 10):
+            columns.append(make_event(ts))
+        before = columns.select(columns.slots())
+        
+        event = make_event(50)
+        setattr(event, field, value)
+        with pytest.raises(error):
+            columns.append(event)
+        
+        assert len(columns) == 4
+        assert columns.select(columns.slots()) == before
+        assert columns.item_counts["Jellopy"] == 4
+        
+        columns.clear()
+        with pytest.raises(error):
+            columns.append(event)
+        assert len(columns) == 0
+        assert list(columns.slots()) == []
+    
+    def test_wraparound_keeps_latest(self, columns):
+        """Testa que o ring buffer sobrescreve os eventos mais antigos."""
+        events = [make_event(ts) for ts in range(10, 70, 10)]
+        for event in events:
+            columns.append(event)
+        
+        assert len(columns) == 4
+        assert columns._start == 2
+        assert columns.select(columns.slots()) == events[2:]
+        assert list(columns.ordered(columns.timestamps_ns)) == [30, 40, 50, 60]
+    
+    def test_wraparound_full_cycle(self, columns):
+        """Testa várias voltas completas do ring buffer."""
+        for ts in range(1, 12):
+            columns.append(make_event(ts))
+        
+        assert [event.timestamp_ns for event in columns.select(columns.slots())] == [8, 9, 10, 11]
+    
+    def test_timerange_across_wrap(self, columns):
+        """Testa busca por intervalo com os eventos divididos em dois segmentos."""
+        for ts in range(10, 70, 10):
+            columns.append(make_event(ts))
+        
+        slots = list(columns.slots_in_timerange(35, 55))
+        
+        assert [columns.timestamps_ns[slot] for slot in slots] == [40, 50]
+        assert list(columns.slots_in_timerange(0, 100)) == list(columns.slots())
+        assert list(columns.slots_in_timerange(61, 100)) == []
+    
+    def test_resize_smaller(self, columns):
+        """Testa redução de capacidade mantendo os eventos mais recentes."""
+        events = [make_event(ts) for ts in range(10, 60, 10)]
+        for event in events:
+            columns.append(event)
+        
+        columns.resize(2)
+        
+        assert columns.capacity == 2
+        assert columns.select(columns.slots()) == events[-2:]
+    
+    def test_resize_larger(self, columns):
+        """Testa aumento de capacidade após o ring buffer dar a volta."""
+        events = [make_event(ts) for ts in range(10, 60, 10)]
+        for event in events:
+            columns.append(event)
+        
+        columns.resize(6)
+        columns.append(make_event(60))
+        columns.append(make_event(70))
+        
+        assert columns.capacity == 6
+        assert [event.timestamp_ns for event in columns.select(columns.slots())] == [
+            20, 30, 40, 50, 60, 70
+        ]
+    
+    def test_snapshot_after_wrap(self, columns):
+        """Testa cópia das colunas em ordem cronológica, independente do original."""
+        events = [make_event(ts) for ts in range(10, 70, 10)]
+        for event in events:
+            columns.append(event)
+        
+        snapshot = columns.snapshot()
+        columns.append(make_event(70, "Apple"))
+        
+        assert len(snapshot) == 4
+        assert list(snapshot.slots()) == [0, 1, 2, 3]
+        assert snapshot.select(snapshot.slots()) == events[2:]
+    
+    def test_snapshot_empty(self, columns):
+        """Testa cópia sem eventos."""
+        snapshot = columns.snapshot()
+        
+        assert len(snapshot) == 0
+        assert list(snapshot.slots()) == []
+
+
+class TestItemEventAggregates:
+    """Testes para os agregados mantidos a cada inserção."""
+    
+    @staticmethod
+    def recount(columns):
+        """Recalcula os agregados percorrendo todos os eventos."""
+        type_counts, item_counts, quantities, monsters, maps = {}, {}, {}, {}, {}
+        for event in columns.select(columns.slots()):
+            code = columns.get_type_code(event.event_type)
+            type_counts[code] = type_counts.get(code, 0) + 1
+            item_counts[event.item_name] = item_counts.get(event.item_name, 0) + 1
+            quantities[event.item_name] = quantities.get(event.item_name, 0) + event.quantity
+            if event.monster_name and event.event_type == 'drop':
+                monsters[event.monster_name] = monsters.get(event.monster_name, 0) + 1
+            maps[event.map_name] = maps.get(event.map_name, 0) + 1
+        return type_counts, item_counts, quantities, monsters, maps
+    
+    @staticmethod
+    def aggregates(columns):
+        """Agregados mantidos pelo armazenamento."""
+        return (dict(columns.type_counts), dict(columns.item_counts),
+                dict(columns.item_quantities), dict(columns.monster_drops),
+                dict(columns.map_counts))
+    
+    @pytest.fixture
+    def events(self):
+        """Eventos variados (tipos, itens, monstros e mapas)."""
+        return [
+            make_event(1, "Jellopy", quantity=2),
+            make_event(2, "Apple", event_type="pickup", monster_name=None),
+            make_event(3, "Jellopy", monster_name="Fabre", map_name="prt_fild08"),
+            make_event(4, "Red Potion", event_type="bought", monster_name=None, quantity=5),
+            make_event(5, "Apple", quantity=3, map_name="prt_fild08"),
+            make_event(6, "Jellopy", event_type="sold", monster_name=None, quantity=2),
+            make_event(7, "Feather", monster_name="Condor", map_name="moc_fild01"),
+        ]
+    
+    def test_aggregates_without_wrap(self, events):
+        """Testa agregados antes de o ring buffer encher."""
+        columns = ItemEventColumns(10)
+        for event in events:
+            columns.append(event)
+        
+        assert self.aggregates(columns) == self.recount(columns)
+        assert columns.item_quantities["Jellopy"] == 5
+        assert columns.monster_drops["Poring"] == 2
+    
+    def test_aggregates_after_wraparound(self, events):
+        """Testa que eventos sobrescritos são descontados dos agregados."""
+        columns = ItemEventColumns(3)
+        for event in events:
+            columns.append(event)
+            assert self.aggregates(columns) == self.recount(columns)
+        
+        # Restam apenas os eventos 5, 6 e 7
+        assert "Red Potion" not in columns.item_counts
+        assert "Red Potion" not in columns.item_quantities
+        assert "Poring" in columns.monster_drops  # Drop do evento 5
+        assert "Fabre" not in columns.monster_drops
+        assert "prontera" in columns.map_counts
+    
+    def test_aggregates_after_resize(self, events):
+        """Testa agregados reconstruídos ao alterar a capacidade."""
+        columns = ItemEventColumns(5)
+        for event in events:
+            columns.append(event)
+        
+        columns.resize(2)
+        
+        assert self.aggregates(columns) == self.recount(columns)
+        assert len(columns) == 2
+
+
+class TestItemEvent:
+    """Testes para ItemEvent."""
+    
+    def test_from_wall_time(self):
+        """Testa criação a partir do horário real."""
+        event = ItemEvent.from_wall_time(
+            1_700_000_000.5, event_type="drop", item_name="Jellopy", item_id=909,
+            quantity=1, map_name="prontera", coordinates=(150, 180)
+        )
+        
+        assert event.timestamp == pytest.approx(1_700_000_000.5, abs=1e-6)
+        assert event.item_name == "Jellopy"
+    
+    def test_dict_round_trip(self):
+        """Testa que to_dict mantém o formato antigo e from_dict o lê de volta."""
+        event = make_event(123_456_789, quantity=4)
+        data = event.to_dict()
+        
+        assert 'timestamp_ns' not in data
+        assert set(data) == set(ItemEvent._fields)
+        
+        restored = ItemEvent.from_dict(data)
+        assert restored.timestamp == pytest.approx(event.timestamp, abs=1e-6)
+        assert restored.quantity == 4
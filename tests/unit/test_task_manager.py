@@ -0,0 +1,401 @@
+"""
+Testes para Task Manager
+========================
+
+Testes unitários para task_manager.py
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+# Adiciona src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from tasks.task_manager import TaskManager
+from tasks.base_task import BaseTask, TaskResult, TaskStatus, TaskPriority
+from core.logging.logger import Logger
+from core.events.event_bus import EventBus
+
+
+class RecordingTask(BaseTask):
+    """Tarefa de teste que registra a ordem de execução."""
+    
+    def __init__(self, name, log, delay=0.0, failures=0, **kwargs):
+        kwargs.setdefault('logger', Mock(spec=Logger))
+        super().__init__(name, **kwargs)
+        self.log = log
+        self.delay = delay
+        self.failures = failures  # Execuções que falham antes de completar
+        self.attempts = 0
+    
+    async def execute(self, context):
+        self.attempts += 1
+        self.log.append(self.name)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.attempts <= self.failures:
+            return TaskResult(TaskStatus.FAILED, "Falha simulada")
+        return TaskResult(TaskStatus.COMPLETED, "OK")
+
+
+async def wait_until(predicate, timeout=2.0):
+    """Aguarda até o predicado ser verdadeiro."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "Timeout aguardando condição"
+        await asyncio.sleep(0.01)
+
+
+class TestTaskManager:
+    """Testes para classe TaskManager."""
+    
+    @pytest.fixture
+    def logger(self):
+        """Logger mock para testes."""
+        return Mock(spec=Logger)
+    
+    @pytest.fixture
+    def event_bus(self):
+        """Event bus mock para testes."""
+        return Mock(spec=EventBus)
+    
+    @pytest.fixture
+    def task_manager(self, logger, event_bus):
+        """TaskManager com um único worker (execução sequencial)."""
+        return TaskManager(logger=logger, event_bus=event_bus, max_concurrent_tasks=1)
+    
+    @pytest.fixture
+    def log(self):
+        """Ordem de execução das tarefas."""
+        return []
+    
+    def test_schedule_task(self, task_manager, event_bus, log):
+        """Testa agendamento e evento task_scheduled."""
+        task = RecordingTask("a", log)
+        
+        assert task_manager.schedule_task(task)
+        assert task_manager.pending_tasks == [task]
+        assert task_manager.get_task(task.task_id) is task
+        assert task_manager.stats['total_scheduled'] == 1
+        event_bus.emit.assert_called_once_with('task_scheduled', task=task)
+    
+    def test_schedule_tasks_single_event(self, task_manager, event_bus, log):
+        """Testa que schedule_tasks emite um único tasks_scheduled."""
+        tasks = [RecordingTask(name, log) for name in ("a", "b", "c")]
+        
+        assert task_manager.schedule_tasks(tasks) == 3
+        event_bus.emit.assert_called_once_with('tasks_scheduled', tasks=tasks)
+    
+    def test_queue_full(self, logger, event_bus, log):
+        """Testa descarte quando a fila está cheia."""
+        manager = TaskManager(logger=logger, event_bus=event_bus, max_queue_size=1)
+        
+        assert manager.schedule_task(RecordingTask("a", log))
+        assert not manager.schedule_task(RecordingTask("b", log))
+        assert len(manager) == 1
+    
+    def test_pending_priority_order(self, task_manager, log):
+        """Testa ordem das pendentes: prioridade, depois chegada."""
+        low = RecordingTask("low", log, priority=TaskPriority.LOW)
+        first = RecordingTask("first", log, priority=TaskPriority.NORMAL)
+        high = RecordingTask("high", log, priority=TaskPriority.HIGH)
+        second = RecordingTask("second", log, priority=TaskPriority.NORMAL)
+        
+        for task in (low, first, high, second):
+            task_manager.schedule_task(task)
+        
+        assert task_manager.pending_tasks == [high, first, second, low]
+    
+    @pytest.mark.asyncio
+    async def test_execution_priority_order(self, task_manager, log):
+        """Testa execução em ordem de prioridade."""
+        for name, priority in (("low", TaskPriority.LOW),
+                               ("normal", TaskPriority.NORMAL),
+                               ("emergency", TaskPriority.EMERGENCY),
+                               ("high", TaskPriority.HIGH)):
+            task_manager.schedule_task(RecordingTask(name, log, priority=priority))
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: len(task_manager.completed_tasks) == 4)
+        finally:
+            task_manager.stop()
+        
+        assert log == ["emergency", "high", "normal", "low"]
+        assert task_manager.stats['total_completed'] == 4
+    
+    @pytest.mark.asyncio
+    async def test_dependency_release(self, task_manager, log):
+        """Testa que o dependente só executa após a dependência completar."""
+        dependency = RecordingTask("dependency", log, priority=TaskPriority.LOW)
+        dependent = RecordingTask("dependent", log, priority=TaskPriority.HIGH)
+        dependent.add_dependency(dependency)
+        
+        task_manager.schedule_task(dependent)
+        task_manager.schedule_task(dependency)
+        
+        # Dependente aguarda fora do heap, mas continua pendente
+        assert dependent in task_manager._blocked
+        assert task_manager.pending_tasks == [dependent, dependency]
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: len(task_manager.completed_tasks) == 2)
+        finally:
+            task_manager.stop()
+        
+        assert log == ["dependency", "dependent"]
+        assert not task_manager._blocked
+    
+    @pytest.mark.asyncio
+    async def test_failed_dependency_keeps_dependent_blocked(self, task_manager, log):
+        """Testa que dependência que falhou não libera o dependente."""
+        dependency = RecordingTask("dependency", log, failures=1, auto_retry=False)
+        dependent = RecordingTask("dependent", log)
+        dependent.add_dependency(dependency)
+        
+        task_manager.schedule_tasks([dependency, dependent])
+        task_manager.start()
+        try:
+            await wait_until(lambda: task_manager.failed_tasks == [dependency])
+            await asyncio.sleep(0.05)
+        finally:
+            task_manager.stop()
+        
+        assert log == ["dependency"]
+        assert dependent.status == TaskStatus.CANCELLED  # Cancelada pelo stop()
+    
+    @pytest.mark.asyncio
+    async def test_removed_dependency_releases_blocked(self, task_manager, log):
+        """Testa que remover a última dependência pendente libera a tarefa."""
+        dependency = RecordingTask("dependency", log)
+        task = RecordingTask("task", log)
+        task.add_dependency(dependency)
+        task_manager.schedule_task(task)
+        assert task in task_manager._blocked
+        
+        task.remove_dependency(dependency)
+        assert not task_manager._blocked
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: task.status == TaskStatus.COMPLETED)
+        finally:
+            task_manager.stop()
+        
+        assert log == ["task"]
+    
+    @pytest.mark.asyncio
+    async def test_dependency_completed_outside_manager(self, task_manager, log):
+        """Testa liberação quando a dependência completa fora do gerenciador."""
+        dependency = RecordingTask("dependency", log)
+        task = RecordingTask("task", log)
+        task.add_dependency(dependency)
+        task_manager.schedule_task(task)
+        
+        task_manager.start()
+        try:
+            await asyncio.sleep(0.05)
+            assert task.status == TaskStatus.PENDING
+            
+            await dependency.run(task_manager.global_context)
+            await wait_until(lambda: task.status == TaskStatus.COMPLETED)
+        finally:
+            task_manager.stop()
+        
+        assert log == ["dependency", "task"]
+    
+    @pytest.mark.asyncio
+    async def test_skipped_task_leaves_indexes(self, task_manager, log):
+        """Testa que tarefa pulada (can_execute falso) sai dos índices."""
+        task = RecordingTask("skipped", log)
+        task.can_execute = lambda context: False
+        task_manager.schedule_task(task)
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: task.result is not None and not task_manager.running_tasks)
+        finally:
+            task_manager.stop()
+        
+        assert task.result.status == TaskStatus.SKIPPED
+        assert log == []
+        assert len(task_manager) == 0
+        assert task_manager.get_task(task.task_id) is None
+        assert task_manager.find_tasks(status=TaskStatus.PENDING) == []
+    
+    def test_cancel_queued_task(self, task_manager, log):
+        """Testa cancelamento de tarefa na fila."""
+        task = RecordingTask("queued", log)
+        other = RecordingTask("other", log)
+        task_manager.schedule_tasks([task, other])
+        
+        assert task_manager.cancel_task(task.task_id)
+        assert task.status == TaskStatus.CANCELLED
+        assert task_manager.pending_tasks == [other]
+        assert task_manager.get_task(task.task_id) is None
+        assert task_manager.stats['total_cancelled'] == 1
+        
+        # Segunda chamada não encontra a tarefa
+        assert not task_manager.cancel_task(task.task_id)
+    
+    def test_cancel_blocked_task(self, task_manager, log):
+        """Testa cancelamento de tarefa aguardando dependências."""
+        dependency = RecordingTask("dependency", log)
+        task = RecordingTask("blocked", log)
+        task.add_dependency(dependency)
+        task_manager.schedule_task(task)
+        
+        assert task_manager.cancel_task(task.task_id)
+        assert task.status == TaskStatus.CANCELLED
+        assert not task_manager._blocked
+        assert task_manager.pending_tasks == []
+    
+    @pytest.mark.asyncio
+    async def test_cancel_running_task(self, task_manager, log):
+        """Testa cancelamento de tarefa em execução."""
+        task = RecordingTask("running", log, delay=10.0)
+        task_manager.schedule_task(task)
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: task.status == TaskStatus.RUNNING)
+            
+            assert task_manager.cancel_task(task.task_id)
+            await wait_until(lambda: not task_manager.running_tasks)
+            
+            # O worker continua disponível para a próxima tarefa
+            follow_up = RecordingTask("follow_up", log)
+            task_manager.schedule_task(follow_up)
+            await wait_until(lambda: follow_up.status == TaskStatus.COMPLETED)
+        finally:
+            task_manager.stop()
+        
+        assert task.status == TaskStatus.CANCELLED
+        assert task_manager.get_task(task.task_id) is None
+        assert task_manager.stats['total_cancelled'] == 1
+        assert log == ["running", "follow_up"]
+    
+    @pytest.mark.asyncio
+    async def test_retry_after_failure(self, task_manager, log):
+        """Testa reagendamento imediato de tarefa que falhou."""
+        task = RecordingTask("flaky", log, failures=1, retry_delay=0)
+        task_manager.schedule_task(task)
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: task.status == TaskStatus.COMPLETED)
+        finally:
+            task_manager.stop()
+        
+        assert task.attempts == 2
+        assert task_manager.stats['total_failed'] == 1
+        assert task_manager.stats['total_completed'] == 1
+        assert task_manager.stats['total_scheduled'] == 2
+    
+    @pytest.mark.asyncio
+    async def test_delayed_retry_stays_indexed(self, task_manager, log):
+        """Testa que tarefa aguardando retry_delay continua consultável."""
+        task = RecordingTask("flaky", log, failures=1, retry_delay=0.1)
+        task_manager.schedule_task(task)
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: task.task_id in task_manager._retrying)
+            assert task_manager.get_task(task.task_id) is task
+            assert task.status == TaskStatus.PENDING
+            
+            await wait_until(lambda: task.status == TaskStatus.COMPLETED)
+        finally:
+            task_manager.stop()
+        
+        assert not task_manager._retrying
+        assert task.attempts == 2
+    
+    @pytest.mark.asyncio
+    async def test_no_retry_when_disabled(self, task_manager, log):
+        """Testa que auto_retry=False não reagenda."""
+        task = RecordingTask("fails", log, failures=1, auto_retry=False)
+        task_manager.schedule_task(task)
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: task_manager.failed_tasks == [task])
+        finally:
+            task_manager.stop()
+        
+        assert task.attempts == 1
+        assert task.status == TaskStatus.FAILED
+    
+    @pytest.mark.asyncio
+    async def test_history_eviction(self, task_manager, log):
+        """Testa limite do histórico e remoção dos índices."""
+        task_manager.max_history = 2
+        tasks = [RecordingTask(f"t{i}", log) for i in range(4)]
+        task_manager.schedule_tasks(tasks)
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: len(task_manager.completed_tasks) == 4)
+        finally:
+            task_manager.stop()
+        
+        await task_manager._periodic_cleanup()
+        
+        assert task_manager.completed_tasks == tasks[2:]
+        assert task_manager.get_task(tasks[0].task_id) is None
+        assert task_manager.get_task(tasks[1].task_id) is None
+        assert task_manager.get_task(tasks[3].task_id) is tasks[3]
+        assert set(task_manager.find_tasks(status=TaskStatus.COMPLETED)) == set(tasks[2:])
+    
+    @pytest.mark.asyncio
+    async def test_history_eviction_keeps_retrying_task(self, task_manager, log):
+        """Testa que tarefa aguardando retry não sai dos índices."""
+        task_manager.max_history = 1
+        flaky = RecordingTask("flaky", log, failures=1, retry_delay=0.2)
+        others = [RecordingTask(f"fails{i}", log, failures=1, auto_retry=False)
+                  for i in range(2)]
+        task_manager.schedule_task(flaky)
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: flaky.task_id in task_manager._retrying)
+            task_manager.schedule_tasks(others)
+            await wait_until(lambda: len(task_manager.failed_tasks) == 3)
+            
+            await task_manager._periodic_cleanup()
+            assert task_manager.failed_tasks == others[1:]
+            assert task_manager.get_task(flaky.task_id) is flaky
+            assert task_manager.get_task(others[0].task_id) is None
+            
+            await wait_until(lambda: flaky.status == TaskStatus.COMPLETED)
+        finally:
+            task_manager.stop()
+    
+    @pytest.mark.asyncio
+    async def test_acquire_task_recycles_evicted(self, task_manager, log):
+        """Testa que só tarefas de acquire_task voltam ao pool."""
+        acquired = task_manager.acquire_task(RecordingTask, "acquired", log)
+        plain = RecordingTask("plain", log)
+        task_manager.schedule_tasks([acquired, plain])
+        
+        task_manager.start()
+        try:
+            await wait_until(lambda: len(task_manager.completed_tasks) == 2)
+        finally:
+            task_manager.stop()
+        
+        task_manager.max_history = 1
+        await task_manager._periodic_cleanup()
+        
+        assert task_manager.completed_tasks == [plain]
+        assert list(task_manager._pool[RecordingTask]) == [acquired]
+        
+        reused = task_manager.acquire_task(RecordingTask, "reused", log)
+        assert reused is acquired
+        assert reused.name == "reused"
+        assert reused.status == TaskStatus.PENDING